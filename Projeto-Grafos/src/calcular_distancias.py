@@ -1,22 +1,43 @@
 
 import os
 import sys
-import json
+import math
 import pandas as pd
-from graphs.io import carregar_adjacencias
-from graphs.algorithms import dijkstra, reconstruir_caminho
+from graphs.io import carregar_adjacencias, salvar_json
+from graphs.algorithms import caminho_minimo, dijkstra_varias_origens, reconstruir_caminho
 
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 ROOT_DIR = os.path.abspath(os.path.join(CURRENT_DIR, ".."))
 os.chdir(ROOT_DIR)
 
 
-def normalizar_bairro(nome):
-    """Normaliza nome do bairro para busca."""
+# Grafias de Setúbal (em minúsculas), tratado como parte de Boa Viagem
+APELIDOS_SETUBAL = ('setúbal', 'setubal', 'boa viagem (setúbal)')
+
+
+def tabela_normalizacao(grafo):
+    """
+    Monta, uma vez, o mapa nome em minúsculas → nome normalizado do bairro.
+    
+    Cobre todos os nós do grafo e as grafias de Setúbal; normalizar_bairro
+    com essa tabela resolve os nomes conhecidos com uma busca no dicionário.
+    """
+    tabela = {no.lower(): no for no in grafo.nodes()}
+    for apelido in APELIDOS_SETUBAL:
+        tabela[apelido] = 'Boa Viagem'
+    return tabela
+
+
+def normalizar_bairro(nome, tabela=None):
+    """Normaliza nome do bairro para busca (consultando primeiro a tabela de tabela_normalizacao, se dada)."""
     if pd.isna(nome):
         return None
+    if tabela is not None:
+        conhecido = tabela.get(str(nome).strip().lower())
+        if conhecido is not None:
+            return conhecido
     nome = str(nome).strip().title()
-    if nome.lower() in ['setúbal', 'setubal', 'boa viagem (setúbal)']:
+    if nome.lower() in APELIDOS_SETUBAL:
         return 'Boa Viagem'
     return nome
 
@@ -70,6 +91,12 @@ def criar_enderecos_exemplo():
 def calcular_distancias():
     """
     Calcula distâncias entre todos os pares de endereços usando Dijkstra.
+    
+    Segue o padrão de tabela muitos-para-muitos: primeiro os bairros são
+    normalizados por coluna e é calculada uma árvore de caminhos mínimos
+    (um Dijkstra) por bairro de origem distinto, em processos paralelos se
+    o trabalho for grande; depois cada par é só uma consulta à árvore da
+    sua origem e a reconstrução do caminho.
     """
     print("=" * 70)
     print("PARTE 6: CALCULANDO DISTÂNCIAS ENTRE ENDEREÇOS")
@@ -96,27 +123,35 @@ def calcular_distancias():
             print("! Formato incorreto, recriando arquivo...")
             df_enderecos = criar_enderecos_exemplo()
     
+    tabela = tabela_normalizacao(grafo)
+    origens = [normalizar_bairro(b, tabela) for b in df_enderecos['bairro_X']]
+    destinos = [normalizar_bairro(b, tabela) for b in df_enderecos['bairro_Y']]
+    nos = set(grafo.nodes())
+    
+    # Uma árvore de caminhos mínimos por origem distinta presente no grafo
+    # (em paralelo quando há muitas origens num grafo grande)
+    origens_distintas = [origem for origem in dict.fromkeys(origens) if origem in nos]
+    arvores = dict(zip(origens_distintas, dijkstra_varias_origens(grafo, origens_distintas)))
+    
     resultados = []
     
-    for idx, row in df_enderecos.iterrows():
-        bairro_origem = normalizar_bairro(row['bairro_X'])
-        bairro_destino = normalizar_bairro(row['bairro_Y'])
-        
+    for idx, (endereco_x, endereco_y, bairro_origem, bairro_destino) in enumerate(
+            zip(df_enderecos['endereco_X'], df_enderecos['endereco_Y'], origens, destinos)):
         print(f"\n{idx + 1}. Calculando: {bairro_origem} → {bairro_destino}")
         
-        if bairro_origem not in grafo.nodes():
+        if bairro_origem not in nos:
             print(f"   ✗ Bairro de origem '{bairro_origem}' não encontrado no grafo")
             custo = None
             caminho = []
-        elif bairro_destino not in grafo.nodes():
+        elif bairro_destino not in nos:
             print(f"   ✗ Bairro de destino '{bairro_destino}' não encontrado no grafo")
             custo = None
             caminho = []
         else:
-            distancias, predecessores = dijkstra(grafo, bairro_origem)
+            distancias, predecessores = arvores[bairro_origem]
+            custo = distancias.get(bairro_destino, math.inf)
             
-            if bairro_destino in distancias and distancias[bairro_destino] != float('inf'):
-                custo = distancias[bairro_destino]
+            if not math.isinf(custo):
                 caminho = reconstruir_caminho(predecessores, bairro_destino)
                 print(f"   ✓ Custo: {custo:.2f}")
                 print(f"   ✓ Caminho ({len(caminho)} bairros): {' → '.join(caminho)}")
@@ -126,8 +161,8 @@ def calcular_distancias():
                 caminho = []
         
         resultados.append({
-            'endereco_X': row['endereco_X'],
-            'endereco_Y': row['endereco_Y'],
+            'endereco_X': endereco_x,
+            'endereco_Y': endereco_y,
             'bairro_X': bairro_origem,
             'bairro_Y': bairro_destino,
             'custo': custo,
@@ -163,16 +198,12 @@ def calcular_percurso_especial(grafo):
         print(f"✗ Bairro '{destino}' não encontrado no grafo")
         return None
     
-    distancias, predecessores = dijkstra(grafo, origem)
+    custo, caminho = caminho_minimo(grafo, origem, destino)
     
-    if destino not in distancias or distancias[destino] == float('inf'):
+    if math.isinf(custo):
         print(f"✗ Não há caminho entre {origem} e {destino}")
         return None
     
-
-    caminho = reconstruir_caminho(predecessores, destino)
-    custo = distancias[destino]
-    
     percurso = {
         "origem": origem,
         "destino": f"{destino} (Setúbal)",
@@ -182,15 +213,16 @@ def calcular_percurso_especial(grafo):
         "detalhes_percurso": []
     }
     
-    for i in range(len(caminho) - 1):
-        atual = caminho[i]
-        proximo = caminho[i + 1]
-        peso_aresta = None
-        for viz, peso, meta in grafo.neighbors(atual):
-            if viz == proximo:
-                peso_aresta = peso
-                logradouro = meta.logradouro if meta.logradouro else "N/A"
-                break
+    # Peso e metadados da aresta de cada nó do caminho até cada vizinho, montados
+    # uma vez; entre arestas paralelas vale a primeira, como na busca linear
+    arestas_caminho = {}
+    for no in dict.fromkeys(caminho):
+        for viz, peso, meta in grafo.neighbors(no):
+            arestas_caminho.setdefault((no, viz), (peso, meta))
+    
+    for i, (atual, proximo) in enumerate(zip(caminho, caminho[1:])):
+        peso_aresta, meta = arestas_caminho[(atual, proximo)]
+        logradouro = meta.logradouro if meta.logradouro else "N/A"
         
         percurso["detalhes_percurso"].append({
             "trecho": i + 1,
@@ -201,8 +233,7 @@ def calcular_percurso_especial(grafo):
         })
     
     output_json = os.path.join(ROOT_DIR, "out", "percurso_nova_descoberta_setubal.json")
-    with open(output_json, 'w', encoding='utf-8') as f:
-        json.dump(percurso, f, ensure_ascii=False, indent=2)
+    salvar_json(percurso, output_json)
     
     print(f"\n✓ Percurso encontrado!")
     print(f"  Origem: {origem}")
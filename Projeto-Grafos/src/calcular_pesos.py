@@ -152,20 +152,23 @@ def processar_adjacencias():
     detalhes_calculo = []
     
     pavimentacao_default = '1'
+    tem_pavimentacao = 'pavimentacao' in df.columns
+    pavimentacoes = df['pavimentacao'] if tem_pavimentacao else [pavimentacao_default] * len(df)
     
-    for idx, row in df.iterrows():
-        pav = row.get('pavimentacao', pavimentacao_default)
-        peso, tipo = calcular_peso(row['logradouro'], pav)
+    # Colunas percorridas com zip: sem montar uma Series por linha (iterrows)
+    for idx, origem, destino, logradouro, pav in zip(df.index, df['bairro_origem'], df['bairro_destino'],
+                                                      df['logradouro'], pavimentacoes):
+        peso, tipo = calcular_peso(logradouro, pav)
         novos_pesos.append(peso)
         tipos_via.append(tipo)
         
         if idx < 5:
             detalhes_calculo.append({
-                'origem': row['bairro_origem'],
-                'destino': row['bairro_destino'],
-                'logradouro': row['logradouro'],
+                'origem': origem,
+                'destino': destino,
+                'logradouro': logradouro,
                 'tipo_via': tipo,
-                'pavimentacao': row.get('pavimentacao', 'asfalto'),
+                'pavimentacao': pav if tem_pavimentacao else 'asfalto',
                 'peso_calculado': peso
             })
     
@@ -187,8 +190,7 @@ def processar_adjacencias():
         with open(csv_output, 'w', newline='', encoding='utf-8') as f:
             writer = csv_module.writer(f)
             writer.writerow(df.columns.tolist())
-            for _, row in df.iterrows():
-                writer.writerow(row.tolist())
+            writer.writerows(df.itertuples(index=False, name=None))
         print(f"\n✓ CSV com pesos calculados salvo em: {csv_output}")
     except Exception as e:
         print(f"\n✗ Erro ao salvar CSV: {e}")
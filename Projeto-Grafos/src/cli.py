@@ -23,6 +23,7 @@ Exemplos de uso:
   python cli.py --distancias             # Calcula distâncias entre endereços
   python cli.py --visualizar             # Gera visualizações
   python cli.py --dashboard              # Gera dashboard interativo
+  python cli.py --dashboard --estatico   # Gera dashboard estático (PNG, somente leitura)
         """
     )
     
@@ -56,6 +57,12 @@ Exemplos de uso:
         help='Gera dashboard interativo completo'
     )
     
+    parser.add_argument(
+        '--estatico',
+        action='store_true',
+        help='Com --dashboard/--all, gera a versão estática do dashboard (imagens PNG, sem interatividade)'
+    )
+    
     parser.add_argument(
         '--origem',
         type=str,
@@ -109,7 +116,7 @@ Exemplos de uso:
             viz_main()
             
             print("\n[4/4] Gerando dashboard...")
-            dash_main()
+            dash_main(estatico=args.estatico)
             
         else:
             if args.metricas:
@@ -130,7 +137,7 @@ Exemplos de uso:
             if args.dashboard:
                 print("\n[Gerando dashboard...]")
                 from dashboard_interativo import main as dash_main
-                dash_main()
+                dash_main(estatico=args.estatico)
         
         if args.origem and args.destino:
             print(f"\n[Calculando rota específica: {args.origem} → {args.destino}]")
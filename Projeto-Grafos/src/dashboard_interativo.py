@@ -12,9 +12,21 @@ import os
 import sys
 import json
 import math
+import base64
+import gzip
+import pickle
+import hashlib
+import heapq
+import multiprocessing as mp
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import plotly.io as pio
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional: sem ele as figuras são serializadas com o json da biblioteca padrão
+    orjson = None
 
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 SRC_DIR = CURRENT_DIR
@@ -24,8 +36,9 @@ if SRC_DIR not in sys.path:
     sys.path.insert(0, SRC_DIR)
 
 from graphs.io import carregar_adjacencias
-from graphs.algorithms import dijkstra, reconstruir_caminho, bfs_arvore, densidade_ego
-from graphs.layout import spring_layout, circular_layout
+from graphs.algorithms import dijkstra, dijkstra_indices, reconstruir_caminho, bfs_arvore, densidades_ego
+from graphs.layout import spring_layout, spring_layout_lbfgs, circular_layout
+from graphs import algorithms, layout
 
 PALETA = {
     'bg': '#1a1d29',
@@ -42,6 +55,285 @@ PALETA = {
     'grid': '#334155'
 }
 
+# Acima deste número de nós o layout minimiza a energia do FR com L-BFGS
+LIMITE_LAYOUT_LBFGS = 500
+
+# Acima deste número de nós o grafo principal não mostra o nome de cada bairro
+LIMITE_ROTULOS = 500
+
+# Acima deste número de nós o mapa de calor só rotula os bairros de grau no percentil 90 ou mais
+LIMITE_ROTULOS_MAPA = 100
+
+# Colunas numéricas maiores que isto vão para o HTML como Float32Array em base64
+LIMITE_COLUNA_BINARIA = 1000
+
+# Acima deste número de nós a tabela de rotas (n² predecessores) não é embutida
+LIMITE_TABELA_ROTAS = 3000
+
+# Acima deste número de arestas (e com mais de um núcleo) os painéis são construídos num Pool;
+# abaixo, construir os sete em série leva bem menos que iniciar o Pool e enviar grafo e figuras
+LIMITE_PAINEIS_PARALELO = 20_000
+
+# Quantos arquivos dashboard_state_<hash>.pkl (os usados mais recentemente) ficam no cache
+LIMITE_ESTADOS_CACHE = 4
+
+# Painéis do dashboard, na ordem das abas
+TITULOS_PAINEIS = [
+    ("grafico1", "Grafo Principal Interativo"),
+    ("grafico2", "Mapa de Calor por Grau"),
+    ("grafico3", "Top 10 Bairros Mais Conectados"),
+    ("grafico4", "Distribuição de Graus"),
+    ("grafico5", "Árvore BFS (Boa Vista)"),
+    ("grafico6", "Percurso Nova Descoberta → Boa Viagem"),
+    ("grafico7", "Ranking de Densidade"),
+]
+
+
+def construir_csr(grafo, ids):
+    """
+    Monta a adjacência do grafo em formato CSR com índices inteiros 0..n-1.
+    
+    Os vizinhos de cada nó ficam ordenados e sem repetição (laços são
+    descartados e, entre arestas paralelas, fica a de menor peso), o que
+    permite rodar Dijkstra direto sobre os arrays.
+    
+    Args:
+        grafo: Objeto Graph
+        ids: Lista de nós; a posição na lista é o índice inteiro do nó
+        
+    Returns:
+        Tupla (indptr, indices, pesos) de arrays numpy
+    """
+    # Parte do CSR em cache do grafo (índices em ordem alfabética) e só
+    # renumera, filtra e ordena os arrays, sem percorrer os vizinhos em Python
+    csr_indptr, csr_indices, csr_pesos, id2name, _ = grafo.to_csr()
+    indice = {no: i for i, no in enumerate(ids)}
+    posicao = np.fromiter((indice[no] for no in id2name), dtype=np.int64, count=len(id2name))
+    
+    origem = np.repeat(posicao, np.diff(np.asarray(csr_indptr, dtype=np.int64)))
+    destino = posicao[np.asarray(csr_indices, dtype=np.int64)]
+    pesos = np.asarray(csr_pesos, dtype=np.float64)
+    sem_laco = origem != destino
+    origem, destino, pesos = origem[sem_laco], destino[sem_laco], pesos[sem_laco]
+    
+    # Ordena por (origem, destino, peso) e fica com a primeira (a mais leve) de cada par
+    ordem = np.lexsort((pesos, destino, origem))
+    origem, destino, pesos = origem[ordem], destino[ordem], pesos[ordem]
+    primeira = np.ones(len(origem), dtype=bool)
+    primeira[1:] = (origem[1:] != origem[:-1]) | (destino[1:] != destino[:-1])
+    origem, indices, pesos = origem[primeira], destino[primeira], pesos[primeira]
+    
+    indptr = np.zeros(len(ids) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum(np.bincount(origem, minlength=len(ids)))
+    return indptr, indices, pesos
+
+
+def calcular_tabela_predecessores(grafo, ids):
+    """
+    Calcula a tabela de predecessores de caminho mínimo entre todos os pares.
+    
+    Roda o Dijkstra uma vez a partir de cada nó; a linha o da tabela guarda,
+    para cada destino d, o índice do predecessor de d no caminho mínimo que
+    sai de o (-1 para a própria origem e para destinos inalcançáveis). Com
+    ela o dashboard reconstrói qualquer rota sem rodar Dijkstra no navegador.
+    
+    Args:
+        grafo: Objeto Graph
+        ids: Lista de nós, na ordem das linhas/colunas da tabela
+        
+    Returns:
+        Matriz numpy int16 (n x n), ou None acima de LIMITE_TABELA_ROTAS nós
+    """
+    n = len(ids)
+    if n > LIMITE_TABELA_ROTAS:
+        return None
+    
+    # Dijkstra trabalha com os índices CSR do grafo; posicao os leva para a ordem de ids
+    _, _, _, id2name, name2id = grafo.to_csr()
+    indice = {no: i for i, no in enumerate(ids)}
+    posicao = np.array([indice[no] for no in id2name], dtype=np.int64)
+    
+    pred = np.full((n, n), -1, dtype=np.int16)
+    for i, origem in enumerate(ids):
+        _, anteriores = dijkstra_indices(grafo, name2id[origem])
+        anteriores = np.asarray(anteriores)
+        alcancados = np.flatnonzero(anteriores >= 0)
+        pred[i, posicao[alcancados]] = posicao[anteriores[alcancados]]
+    
+    return pred
+
+
+def rota_da_tabela(grafo, pred, ids, origem, destino):
+    """
+    Reconstrói o caminho mínimo origem → destino pela tabela de predecessores.
+    
+    Evita rodar de novo o Dijkstra da origem, que a tabela já contém. O custo
+    é acumulado ao longo do caminho na mesma ordem do Dijkstra (com o menor
+    peso entre arestas paralelas), então sai igual à distância calculada por ele.
+    
+    Args:
+        grafo: Objeto Graph
+        pred: Tabela de calcular_tabela_predecessores
+        ids: Lista de nós, na ordem das linhas/colunas da tabela
+        origem: Nó de origem
+        destino: Nó de destino
+        
+    Returns:
+        Tupla (custo, caminho); (inf, []) se o destino é inalcançável
+    """
+    indice = {no: i for i, no in enumerate(ids)}
+    o, atual = indice[origem], indice[destino]
+    linha = pred[o]
+    
+    caminho = [atual]
+    while atual != o:
+        atual = int(linha[atual])
+        if atual < 0:
+            return math.inf, []
+        caminho.append(atual)
+    caminho = [ids[i] for i in reversed(caminho)]
+    
+    custo = 0.0
+    for a, b in zip(caminho, caminho[1:]):
+        custo += min(peso for v, peso, _ in grafo.neighbors(a) if v == b)
+    return custo, caminho
+
+
+def chave_estado(grafo, df_bairros, parametros_layout):
+    """
+    Calcula a chave (hash) do estado pré-computado do dashboard.
+    
+    A chave cobre a ordem dos nós (o layout depende dela), as arestas com
+    seus pesos, as microrregiões dos bairros, os parâmetros do layout e o
+    código dos módulos que calculam o estado, para que uma mudança em
+    qualquer um deles invalide o cache.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr(grafo.nodes()).encode('utf-8'))
+    h.update(repr(sorted((u, v, w) for u, v, w, _ in grafo.edges())).encode('utf-8'))
+    h.update(repr(sorted(zip(df_bairros['bairro'].astype(str), df_bairros['microrregiao'].astype(str)))).encode('utf-8'))
+    h.update(repr(sorted(parametros_layout.items())).encode('utf-8'))
+    for modulo in (__file__, layout.__file__, algorithms.__file__):
+        with open(modulo, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def carregar_estado_dashboard(grafo, df_bairros, out_dir):
+    """
+    Devolve layout, graus, densidades, microrregiões e tabela de rotas, usando cache em disco.
+    
+    Grafos com mais de LIMITE_LAYOUT_LBFGS nós usam spring_layout_lbfgs, que
+    converge em menos avaliações de força que o FR de temperatura fixa; os
+    demais usam spring_layout. O layout é sempre calculado do zero, então
+    depende só do grafo e dos parâmetros, nunca do histórico do cache.
+    
+    O estado é salvo em out_dir/.cache/dashboard_state_<hash>.pkl e
+    reaproveitado enquanto as entradas não mudarem. Só os
+    LIMITE_ESTADOS_CACHE estados usados mais recentemente são mantidos.
+    
+    Returns:
+        Tupla (pos, graus, densidades, micro_dict, pred)
+    """
+    parametros_layout = {'k': 1.5, 'iterations': 50, 'seed': 42}
+    cache_dir = os.path.join(out_dir, '.cache')
+    chave = chave_estado(grafo, df_bairros, parametros_layout)
+    arquivo = os.path.join(cache_dir, f'dashboard_state_{chave}.pkl')
+    
+    if os.path.exists(arquivo):
+        try:
+            with open(arquivo, 'rb') as f:
+                estado = pickle.load(f)
+            os.utime(arquivo)
+            print(f"→ Estado pré-computado carregado do cache ({chave[:8]})")
+            return estado
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+    
+    os.makedirs(cache_dir, exist_ok=True)
+    if grafo.order() > LIMITE_LAYOUT_LBFGS:
+        pos = spring_layout_lbfgs(grafo, k=parametros_layout['k'], seed=parametros_layout['seed'])
+    else:
+        pos = spring_layout(grafo, **parametros_layout)
+    
+    ids = grafo.nodes()
+    graus = {no: grafo.degree(no) for no in ids}
+    densidades = densidades_ego(grafo)
+    
+    if 'microrregiao' in df_bairros.columns:
+        micro_dict = dict(zip(df_bairros['bairro'], df_bairros['microrregiao'].fillna('N/A')))
+    else:
+        micro_dict = dict.fromkeys(df_bairros['bairro'], 'N/A')
+    
+    pred = calcular_tabela_predecessores(grafo, ids)
+    
+    estado = (pos, graus, densidades, micro_dict, pred)
+    with open(arquivo, 'wb') as f:
+        pickle.dump(estado, f, protocol=pickle.HIGHEST_PROTOCOL)
+    podar_estados_cache(cache_dir)
+    
+    return estado
+
+
+def podar_estados_cache(cache_dir, manter=None):
+    """
+    Apaga os dashboard_state_*.pkl antigos, mantendo os usados mais recentemente.
+    
+    Cada combinação de grafo, parâmetros e código gera um arquivo novo; sem
+    poda o diretório de cache só cresce. O uso é medido pelo mtime, que
+    carregar_estado_dashboard atualiza a cada leitura do cache.
+    
+    Args:
+        cache_dir: Diretório do cache
+        manter: Quantos arquivos manter (None = LIMITE_ESTADOS_CACHE)
+    """
+    manter = LIMITE_ESTADOS_CACHE if manter is None else manter
+    arquivos = [os.path.join(cache_dir, nome) for nome in os.listdir(cache_dir)
+                if nome.startswith('dashboard_state_') and nome.endswith('.pkl')]
+    arquivos.sort(key=os.path.getmtime, reverse=True)
+    for caminho in arquivos[manter:]:
+        try:
+            os.remove(caminho)
+        except OSError:
+            pass
+
+
+def codificar_base64(valores, dtype):
+    """Codifica valores como array numpy little-endian do dtype dado, em base64 (para typed arrays no JS)."""
+    return base64.b64encode(np.asarray(valores, dtype=dtype).tobytes()).decode('ascii')
+
+
+def colunas_js(df, colunas_binarias=(), colunas_tipadas=None):
+    """
+    Serializa um DataFrame como objeto JS de colunas (struct-of-arrays).
+    
+    Cada coluna vira um array, já no formato que as traces do Plotly usam.
+    Colunas numéricas listadas em colunas_binarias com mais de
+    LIMITE_COLUNA_BINARIA valores vão como Float32Array em base64, que é
+    menor e mais rápido de decodificar do que JSON. Colunas em
+    colunas_tipadas viram o typed array indicado (memória contígua, sem
+    objetos por elemento).
+    
+    Args:
+        df: DataFrame a serializar
+        colunas_binarias: Colunas numéricas elegíveis para Float32Array
+        colunas_tipadas: Dicionário {coluna: nome do typed array JS}
+        
+    Returns:
+        Texto de um literal de objeto JS {coluna: array}
+    """
+    colunas_tipadas = colunas_tipadas or {}
+    partes = []
+    for coluna in df.columns:
+        if coluna in colunas_binarias and len(df) > LIMITE_COLUNA_BINARIA:
+            b64 = codificar_base64(df[coluna].to_numpy(), '<f4')
+            partes.append(f'{json.dumps(coluna)}: decodificarBase64("{b64}", Float32Array)')
+        elif coluna in colunas_tipadas:
+            partes.append(f'{json.dumps(coluna)}: new {colunas_tipadas[coluna]}({json.dumps(df[coluna].tolist())})')
+        else:
+            partes.append(f'{json.dumps(coluna)}: {json.dumps(df[coluna].tolist())}')
+    return '{' + ', '.join(partes) + '}'
+
 
 def normalizar_texto(valor, fallback):
     """Normaliza valores vindos do CSV, lidando com NaN e strings vazias."""
@@ -56,7 +348,155 @@ def normalizar_texto(valor, fallback):
     return texto
 
 
-def criar_html_unificado(grafo, df_bairros, out_dir):
+def construir_painel(painel):
+    """
+    Constrói a figura de um painel e devolve seu dicionário Plotly.
+    
+    Função de nível de módulo para poder ser enviada aos processos do Pool.
+    Os traces e o layout já foram validados ao serem criados pelas funções
+    criar_*, então o dicionário é montado com to_plotly_json sem passar por
+    um go.Figure (que os copiaria e validaria de novo); o template padrão,
+    que o go.Figure acrescentaria, é incluído no layout. A serialização
+    fica para a escrita do HTML, uma única vez para todos os painéis.
+    
+    Args:
+        painel: Tupla (id, mensagem, função criar_*, argumentos)
+        
+    Returns:
+        Dicionário com 'data' e 'layout' da figura Plotly
+    """
+    _, _, criar, args = painel
+    figura = criar(*args)
+    layout_fig = figura['layout'].to_plotly_json()
+    layout_fig.setdefault('template', pio.templates[pio.templates.default].to_plotly_json())
+    dados = [trace.to_plotly_json() for trace in figura['data']]
+    return {'data': dados, 'layout': layout_fig}
+
+
+def construir_paineis(paineis, paralelo=False, processos=None):
+    """
+    Constrói os painéis do dashboard, em série ou num Pool de processos.
+    
+    Os painéis são independentes entre si (funções puras do grafo e das
+    métricas), então em grafos grandes cada um pode ser construído em um
+    processo do Pool. Em série, a mensagem de cada painel é exibida antes
+    de construí-lo; no Pool, quando ele fica pronto (na ordem dos painéis).
+    
+    Args:
+        paineis: Lista de tuplas (id, mensagem, função criar_*, argumentos)
+        paralelo: Usa o Pool de processos
+        processos: Número de processos do Pool (None usa o número de núcleos)
+        
+    Returns:
+        Dicionário {id: figura}, na ordem dos painéis
+    """
+    graficos = {}
+    
+    if paralelo:
+        processos = min(processos or os.cpu_count() or 1, len(paineis))
+        with mp.Pool(processos) as pool:
+            for painel, figura in zip(paineis, pool.imap(construir_painel, paineis)):
+                print(painel[1])
+                graficos[painel[0]] = figura
+    else:
+        for painel in paineis:
+            print(painel[1])
+            graficos[painel[0]] = construir_painel(painel)
+    
+    return graficos
+
+
+def criar_html_estatico(graficos, num_nos, num_arestas, out_dir):
+    """
+    Gera a versão estática (somente leitura) do dashboard.
+    
+    Cada painel é renderizado no servidor como PNG (via kaleido) e o HTML
+    apenas referencia as imagens: não carrega o plotly.js nem embute o JSON
+    dos gráficos. Os controles interativos (rotas, clique nas arestas)
+    ficam de fora.
+    
+    Args:
+        graficos: Dicionário {id do painel: figura} de construir_paineis
+        num_nos: Número de bairros (exibido no cabeçalho)
+        num_arestas: Número de conexões (exibido no cabeçalho)
+        out_dir: Diretório de saída
+        
+    Returns:
+        Caminho completo do arquivo HTML gerado
+    """
+    img_dir = os.path.join(out_dir, 'dashboard_estatico')
+    os.makedirs(img_dir, exist_ok=True)
+    
+    secoes = []
+    for painel_id, titulo in TITULOS_PAINEIS:
+        print(f"Renderizando {titulo}...")
+        fig = go.Figure(graficos[painel_id])
+        fig.write_image(os.path.join(img_dir, f'{painel_id}.png'),
+                        width=1600, height=fig.layout.height or 1000, scale=2)
+        secoes.append(
+            f'        <section class="painel">\n'
+            f'            <h2>{titulo}</h2>\n'
+            f'            <img src="dashboard_estatico/{painel_id}.png" alt="{titulo}" loading="lazy">\n'
+            f'        </section>'
+        )
+    
+    html = f"""<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Dashboard - Rede Urbana do Recife (versão estática)</title>
+    <style>
+        body {{
+            margin: 0;
+            padding: 24px;
+            background: {PALETA['bg']};
+            color: {PALETA['texto']};
+            font-family: 'Segoe UI', Arial, sans-serif;
+        }}
+        header {{
+            margin-bottom: 24px;
+        }}
+        header p {{
+            color: {PALETA['texto_sec']};
+        }}
+        .painel {{
+            background: {PALETA['paper']};
+            border-radius: 8px;
+            padding: 16px;
+            margin-bottom: 24px;
+        }}
+        .painel h2 {{
+            margin-top: 0;
+            font-size: 18px;
+        }}
+        .painel img {{
+            width: 100%;
+            height: auto;
+        }}
+    </style>
+</head>
+<body>
+    <header>
+        <h1>Rede Urbana do Recife</h1>
+        <p>{num_nos} bairros · {num_arestas} conexões · versão estática (somente leitura)</p>
+    </header>
+    <main>
+{chr(10).join(secoes)}
+    </main>
+</body>
+</html>
+"""
+    
+    arquivo = os.path.join(out_dir, 'dashboard_estatico.html')
+    with open(arquivo, 'w', encoding='utf-8') as f:
+        f.write(html)
+    
+    print(f"\n→ Dashboard estático gerado: {arquivo}")
+    return arquivo
+
+
+def criar_html_unificado(grafo, df_bairros, out_dir, processos=None, estatico=False):
     """
     Gera o arquivo HTML unificado contendo todas as visualizações.
     
@@ -64,6 +504,10 @@ def criar_html_unificado(grafo, df_bairros, out_dir):
         grafo: Objeto Graph contendo a estrutura de dados do grafo
         df_bairros: DataFrame com informações dos bairros
         out_dir: Diretório de saída para o arquivo HTML
+        processos: Processos do Pool que constrói os painéis em grafos com mais
+            de LIMITE_PAINEIS_PARALELO arestas (None = núcleos)
+        estatico: Se True, gera a versão estática (PNG + HTML sem plotly.js)
+            em vez do dashboard interativo
         
     Returns:
         Caminho completo do arquivo HTML gerado
@@ -74,87 +518,78 @@ def criar_html_unificado(grafo, df_bairros, out_dir):
     print("="*70 + "\n")
     
     print("Preparando dados do grafo principal...")
-    pos = spring_layout(grafo, k=1.5, iterations=50, seed=42)
-    
-    graus = {no: grafo.degree(no) for no in grafo.nodes()}
-    densidades = {no: densidade_ego(grafo, no) for no in grafo.nodes()}
-    
-    micro_dict = {}
-    for _, row in df_bairros.iterrows():
-        micro_dict[row['bairro']] = row.get('microrregiao', 'N/A')
-    
-    nodes_data = []
-    for no in grafo.nodes():
-        x, y = pos[no]
-        nodes_data.append({
-            'id': no,
-            'x': x,
-            'y': y,
-            'grau': graus[no],
-            'densidade': densidades[no],
-            'microregiao': micro_dict.get(no, 'N/A')
-        })
-    
-    edges_data = []
+    pos, graus, densidades, micro_dict, pred = carregar_estado_dashboard(grafo, df_bairros, out_dir)
+    
+    # 4 casas decimais bastam para posições em [-1, 1] na tela e encurtam bastante o JSON embutido
+    pos = {no: (round(x, 4), round(y, 4)) for no, (x, y) in pos.items()}
+    
+    ids = grafo.nodes()
+    xs, ys = np.asarray([pos[no] for no in ids], dtype=float).reshape(-1, 2).T
+    df_nodes = pd.DataFrame({
+        'id': ids,
+        'x': xs,
+        'y': ys,
+        'grau': [graus[no] for no in ids],
+        'densidade': [densidades[no] for no in ids],
+        'microregiao': [micro_dict.get(no, 'N/A') for no in ids]
+    })
+    # Faixa de cor (0: grau <= 3, 1: grau 4-7, 2: grau >= 8) e tamanho base de cada nó, que só dependem do grau
+    df_nodes['cor'] = np.digitize(df_nodes['grau'], [4, 8])
+    df_nodes['tamanho'] = df_nodes['grau'] * 3 + 12
+    
+    # Uma única passada pelas arestas preenche as colunas da tabela de arestas; as
+    # extremidades vão como índices inteiros em ids (nomes e coordenadas saem da tabela de nós)
+    indice = {no: i for i, no in enumerate(ids)}
+    extremidades = []
+    colunas = {nome: [] for nome in ('peso', 'logradouro', 'observacao')}
     for u, v, peso, meta in grafo.edges():
-        x0, y0 = pos[u]
-        x1, y1 = pos[v]
-        logradouro = normalizar_texto(getattr(meta, 'logradouro', None), 'Sem informação')
-        observacao = normalizar_texto(getattr(meta, 'observacao', None), 'Sem observação')
-        edges_data.append({
-            'source': u,
-            'target': v,
-            'x0': x0,
-            'y0': y0,
-            'x1': x1,
-            'y1': y1,
-            'peso': peso,
-            'logradouro': logradouro,
-            'observacao': observacao
-        })
-    
-    bairros_list = sorted([no for no in grafo.nodes()])
-    nodes_json = json.dumps(nodes_data)
-    edges_json = json.dumps(edges_data)
+        extremidades.extend((indice[u], indice[v]))
+        colunas['peso'].append(round(float(peso), 2))
+        colunas['logradouro'].append(normalizar_texto(getattr(meta, 'logradouro', None), 'Sem informação'))
+        colunas['observacao'].append(normalizar_texto(getattr(meta, 'observacao', None), 'Sem observação'))
+    df_edges = pd.DataFrame(colunas)
+    
+    bairros_list = sorted(grafo.nodes())
+    nos_js = colunas_js(df_nodes, colunas_binarias=('x', 'y'), colunas_tipadas={
+        'grau': 'Int32Array', 'densidade': 'Float64Array', 'cor': 'Uint8Array', 'tamanho': 'Int32Array'})
+    arestas_js = colunas_js(df_edges)
+    
+    # Índices de nós em Int16 enquanto couberem; adjacência em CSR para o Dijkstra do navegador
+    tipo_indice, tipo_indice_js = ('<i2', 'Int16Array') if len(ids) < 2 ** 15 else ('<i4', 'Int32Array')
+    indptr, indices, pesos = construir_csr(grafo, ids)
+    extremidades_b64 = codificar_base64(extremidades, tipo_indice)
+    indptr_b64 = codificar_base64(indptr, '<i4')
+    indices_b64 = codificar_base64(indices, tipo_indice)
+    pesos_b64 = codificar_base64(pesos, '<f8')
     bairros_json = json.dumps(bairros_list)
-    
-    print("Criando grafo principal...")
-    grafo_principal_dict = criar_grafo_principal(grafo, pos, graus, densidades, micro_dict)
-    fig1 = go.Figure(data=grafo_principal_dict['data'], layout=grafo_principal_dict['layout'])
-    grafo_principal_json = json.loads(fig1.to_json())
-    
-    print("Criando mapa de calor...")
-    mapa_calor_dict = criar_mapa_calor_grau(grafo, pos, graus)
-    fig2 = go.Figure(data=mapa_calor_dict['data'], layout=mapa_calor_dict['layout'])
-    mapa_calor_json = json.loads(fig2.to_json())
-    
-    print("Criando subgrafo Top 10...")
-    top10_dict = criar_top10_subgrafo(grafo, graus)
-    fig3 = go.Figure(data=top10_dict['data'], layout=top10_dict['layout'])
-    top10_json = json.loads(fig3.to_json())
-    
-    print("Criando distribuição de graus...")
-    distribuicao_dict = criar_distribuicao_graus(graus)
-    fig4 = go.Figure(data=distribuicao_dict['data'], layout=distribuicao_dict['layout'])
-    distribuicao_json = json.loads(fig4.to_json())
-    
-    print("Criando árvore BFS...")
-    arvore_bfs_dict = criar_arvore_bfs(grafo, "Boa Vista")
-    fig5 = go.Figure(data=arvore_bfs_dict['data'], layout=arvore_bfs_dict['layout'])
-    arvore_bfs_json = json.loads(fig5.to_json())
-    
-    print("Criando árvore de percurso...")
-    arvore_percurso_dict = criar_arvore_percurso(grafo, "Nova Descoberta", "Boa Viagem", pos)
-    fig6 = go.Figure(data=arvore_percurso_dict['data'], layout=arvore_percurso_dict['layout'])
-    arvore_percurso_json = json.loads(fig6.to_json())
-    
-    print("Criando ranking de densidade...")
-    ranking_dict = criar_ranking_densidade(densidades, micro_dict)
-    fig7 = go.Figure(data=ranking_dict['data'], layout=ranking_dict['layout'])
-    ranking_json = json.loads(fig7.to_json())
+    # Mesma lista de opções nos seletores de origem e destino: montada uma vez só
+    options_html = "\n".join(f'                                    <option value="{b}">{b}</option>' for b in bairros_list)
+    pred_b64 = codificar_base64(pred, '<i2') if pred is not None else ''
+    
+    # A rota do painel de percurso sai da tabela de predecessores, sem outro Dijkstra
+    rota_percurso = rota_da_tabela(grafo, pred, ids, "Nova Descoberta", "Boa Viagem") if pred is not None else None
+    
+    paineis = [
+        ("grafico1", "Criando grafo principal...", criar_grafo_principal, (grafo, pos, graus, densidades, micro_dict)),
+        ("grafico2", "Criando mapa de calor...", criar_mapa_calor_grau, (grafo, pos, graus)),
+        ("grafico3", "Criando subgrafo Top 10...", criar_top10_subgrafo, (grafo, graus)),
+        ("grafico4", "Criando distribuição de graus...", criar_distribuicao_graus, (graus,)),
+        ("grafico5", "Criando árvore BFS...", criar_arvore_bfs, (grafo, "Boa Vista")),
+        ("grafico6", "Criando árvore de percurso...", criar_arvore_percurso, (grafo, "Nova Descoberta", "Boa Viagem", pos, rota_percurso)),
+        ("grafico7", "Criando ranking de densidade...", criar_ranking_densidade, (densidades, micro_dict)),
+    ]
+    paralelo = (os.cpu_count() or 1) > 1 and grafo.size() > LIMITE_PAINEIS_PARALELO
+    graficos = construir_paineis(paineis, paralelo, processos)
+    
+    if estatico:
+        print("\nGerando dashboard estático...")
+        return criar_html_estatico(graficos, len(df_nodes), len(df_edges), out_dir)
     
     print("\nGerando HTML unificado...")
     
+    # Única serialização das figuras, com o motor orjson quando instalado
+    graficos_json = pio.json.to_json_plotly(graficos, engine='orjson' if orjson is not None else 'json')
+    
     html = f"""<!DOCTYPE html>
 <html lang="pt-BR">
 <head>
@@ -679,11 +1114,11 @@ def criar_html_unificado(grafo, df_bairros, out_dir):
             </div>
             <div class="header-stats">
                 <div class="stat-item">
-                    <div class="stat-value">{len(grafo.nodes())}</div>
+                    <div class="stat-value">{len(df_nodes)}</div>
                     <div class="stat-label">Bairros</div>
                 </div>
                 <div class="stat-item">
-                    <div class="stat-value">{len(grafo.edges())}</div>
+                    <div class="stat-value">{len(df_edges)}</div>
                     <div class="stat-label">Conexões</div>
                 </div>
                 <div class="stat-item">
@@ -739,7 +1174,7 @@ def criar_html_unificado(grafo, df_bairros, out_dir):
                                 <label class="input-label">Ponto de Origem</label>
                                 <select id="origemSelect">
                                     <option value="">Selecione o bairro de origem...</option>
-{chr(10).join(f'                                    <option value="{b}">{b}</option>' for b in bairros_list)}
+{options_html}
                                 </select>
                             </div>
                             
@@ -747,7 +1182,7 @@ def criar_html_unificado(grafo, df_bairros, out_dir):
                                 <label class="input-label">Ponto de Destino</label>
                                 <select id="destinoSelect">
                                     <option value="">Selecione o bairro de destino...</option>
-{chr(10).join(f'                                    <option value="{b}">{b}</option>' for b in bairros_list)}
+{options_html}
                                 </select>
                             </div>
                             
@@ -902,11 +1337,15 @@ def criar_html_unificado(grafo, df_bairros, out_dir):
     </div>
     
     <script>
+        const LIMITE_ROTULOS = {LIMITE_ROTULOS};
+        
         // Paleta de cores
         const PALETA = {{
             bg: '#1a1d29',
             paper: '#242837',
             primario: '#2563eb',
+            secundario: '#3b82f6',
+            terciario: '#60a5fa',
             destaque: '#06b6d4',
             alerta: '#f59e0b',
             sucesso: '#10b981',
@@ -915,86 +1354,170 @@ def criar_html_unificado(grafo, df_bairros, out_dir):
             texto_sec: '#94a3b8'
         }};
         
-        // Dados dos nós e arestas para interatividade
-        const nodesData = {nodes_json};
-        const edgesData = {edges_json};
+        function decodificarBase64(b64, Tipo) {{
+            return new Tipo(Uint8Array.from(atob(b64), c => c.charCodeAt(0)).buffer);
+        }}
+        
+        // Dados dos nós e arestas para interatividade, em colunas (um array por campo)
+        const nos = {nos_js};
+        const arestas = {arestas_js};
+        const numNos = nos.id.length;
+        const numArestas = arestas.peso.length;
+        const indiceNo = new Map(nos.id.map((id, i) => [id, i]));
+        const nodeHover = nos.id.map((id, i) => `<b>${{id}}</b><br>Grau: ${{nos.grau[i]}}<br>Densidade: ${{nos.densidade[i].toFixed(3)}}`);
+        
+        // Extremidades das arestas como índices em nos.id: [u0, v0, u1, v1, ...]
+        const ARESTAS_NOS = decodificarBase64('{extremidades_b64}', {tipo_indice_js});
+        
+        // Adjacência em CSR: vizinhos do nó i em INDICES[INDPTR[i]..INDPTR[i+1]), pesos em WEIGHTS
+        const INDPTR = decodificarBase64('{indptr_b64}', Int32Array);
+        const INDICES = decodificarBase64('{indices_b64}', {tipo_indice_js});
+        const WEIGHTS = decodificarBase64('{pesos_b64}', Float64Array);
+        
+        // Cor base de cada nó pela faixa de grau calculada em Python
+        const TABELA_CORES = [PALETA.terciario, PALETA.secundario, PALETA.primario];
+        const coresBase = Array.from(nos.cor, c => TABELA_CORES[c]);
         
         // Dados dos gráficos
-        const graficos = {json.dumps({
-            'grafico1': grafo_principal_json,
-            'grafico2': mapa_calor_json,
-            'grafico3': top10_json,
-            'grafico4': distribuicao_json,
-            'grafico5': arvore_bfs_json,
-            'grafico6': arvore_percurso_json,
-            'grafico7': ranking_json
-        })};
+        const graficos = {graficos_json};
 
         function makeEdgeKey(a, b) {{
-            return [a, b].sort((lhs, rhs) => lhs.localeCompare(rhs)).join('||');
+            return a < b ? a + '||' + b : b + '||' + a;
         }}
         
-        // Construir grafo de adjacência para Dijkstra
-        function construirGrafoAdjacencia() {{
-            const grafo = {{}};
-            edgesData.forEach(e => {{
-                if (!grafo[e.source]) grafo[e.source] = [];
-                if (!grafo[e.target]) grafo[e.target] = [];
-                grafo[e.source].push({{no: e.target, peso: e.peso}});
-                grafo[e.target].push({{no: e.source, peso: e.peso}});
-            }});
-            return grafo;
+        // Peso da aresta entre os nós i e j (a CSR já guarda o menor entre arestas paralelas)
+        function pesoAresta(i, j) {{
+            for (let p = INDPTR[i]; p < INDPTR[i + 1]; p++) {{
+                if (INDICES[p] === j) return WEIGHTS[p];
+            }}
+            return Infinity;
         }}
         
-        const grafoAdjacencia = construirGrafoAdjacencia();
+        // Tabela de predecessores pré-calculada em Python (linha = origem, coluna = destino,
+        // índices na ordem de nos.id). Vazia em grafos grandes: aí a rota usa o Dijkstra abaixo.
+        const PRED_B64 = '{pred_b64}';
+        const PRED = PRED_B64 ? decodificarBase64(PRED_B64, Int16Array) : null;
+        
+        // Reconstrói a rota andando pela tabela de predecessores (O(tamanho do caminho))
+        function reconstruirCaminho(origem, destino) {{
+            const n = numNos;
+            const o = indiceNo.get(origem);
+            let atual = indiceNo.get(destino);
+            if (o === undefined || atual === undefined) {{
+                return {{caminho: null, custo: null}};
+            }}
+            
+            const caminho = [];
+            while (atual !== o) {{
+                if (atual < 0) return {{caminho: null, custo: null}};
+                caminho.push(atual);
+                atual = PRED[o * n + atual];
+            }}
+            caminho.push(o);
+            caminho.reverse();
+            
+            let custo = 0;
+            for (let i = 0; i < caminho.length - 1; i++) {{
+                custo += pesoAresta(caminho[i], caminho[i + 1]);
+            }}
+            
+            return {{caminho: caminho.map(i => nos.id[i]), custo}};
+        }}
         
         // Algoritmo de Dijkstra em JavaScript
-        function dijkstra(grafo, origem, destino) {{
-            const distancias = {{}};
-            const predecessores = {{}};
-            const visitados = new Set();
-            const fila = [];
+        // Heap binário de mínimo ordenado por dist (fila de prioridade do Dijkstra)
+        class MinHeap {{
+            constructor() {{
+                this.itens = [];
+            }}
             
-            Object.keys(grafo).forEach(no => {{
-                distancias[no] = Infinity;
-                predecessores[no] = null;
-            }});
-            distancias[origem] = 0;
-            fila.push({{no: origem, dist: 0}});
+            get length() {{
+                return this.itens.length;
+            }}
+            
+            push(item) {{
+                const itens = this.itens;
+                let i = itens.length;
+                itens.push(item);
+                while (i > 0) {{
+                    const pai = (i - 1) >> 1;
+                    if (itens[pai].dist <= item.dist) break;
+                    itens[i] = itens[pai];
+                    i = pai;
+                }}
+                itens[i] = item;
+            }}
+            
+            pop() {{
+                const itens = this.itens;
+                const topo = itens[0];
+                const ultimo = itens.pop();
+                const n = itens.length;
+                if (n > 0) {{
+                    let i = 0;
+                    while (true) {{
+                        let menor = 2 * i + 1;
+                        if (menor >= n) break;
+                        if (menor + 1 < n && itens[menor + 1].dist < itens[menor].dist) menor++;
+                        if (itens[menor].dist >= ultimo.dist) break;
+                        itens[i] = itens[menor];
+                        i = menor;
+                    }}
+                    itens[i] = ultimo;
+                }}
+                return topo;
+            }}
+        }}
+        
+        // Dijkstra sobre a CSR, com índices inteiros e typed arrays (sem objetos indexados por nome)
+        function dijkstra(origem, destino) {{
+            const o = indiceNo.get(origem);
+            const d = indiceNo.get(destino);
+            if (o === undefined || d === undefined) {{
+                return {{caminho: null, custo: null}};
+            }}
+            
+            const distancias = new Float64Array(numNos).fill(Infinity);
+            const predecessores = new Int32Array(numNos).fill(-1);
+            const visitados = new Uint8Array(numNos);
+            const fila = new MinHeap();
+            
+            distancias[o] = 0;
+            fila.push({{no: o, dist: 0}});
             
             while (fila.length > 0) {{
-                fila.sort((a, b) => a.dist - b.dist);
-                const {{no: atual, dist: distAtual}} = fila.shift();
+                const {{no: atual, dist: distAtual}} = fila.pop();
                 
-                if (visitados.has(atual)) continue;
-                visitados.add(atual);
+                // Entradas antigas (já superadas por uma distância menor) são descartadas
+                if (visitados[atual] || distAtual > distancias[atual]) continue;
+                visitados[atual] = 1;
                 
-                if (atual === destino) break;
+                if (atual === d) break;
                 
-                grafo[atual].forEach(vizinho => {{
-                    if (visitados.has(vizinho.no)) return;
+                for (let p = INDPTR[atual]; p < INDPTR[atual + 1]; p++) {{
+                    const vizinho = INDICES[p];
+                    if (visitados[vizinho]) continue;
                     
-                    const novaDist = distAtual + vizinho.peso;
-                    if (novaDist < distancias[vizinho.no]) {{
-                        distancias[vizinho.no] = novaDist;
-                        predecessores[vizinho.no] = atual;
-                        fila.push({{no: vizinho.no, dist: novaDist}});
+                    const novaDist = distAtual + WEIGHTS[p];
+                    if (novaDist < distancias[vizinho]) {{
+                        distancias[vizinho] = novaDist;
+                        predecessores[vizinho] = atual;
+                        fila.push({{no: vizinho, dist: novaDist}});
                     }}
-                }});
+                }}
             }}
             
-            if (distancias[destino] === Infinity) {{
+            if (distancias[d] === Infinity) {{
                 return {{caminho: null, custo: null}};
             }}
             
             const caminho = [];
-            let atual = destino;
-            while (atual !== null) {{
-                caminho.unshift(atual);
-                atual = predecessores[atual];
+            for (let atual = d; atual !== -1; atual = predecessores[atual]) {{
+                caminho.push(nos.id[atual]);
             }}
+            caminho.reverse();
             
-            return {{caminho, custo: distancias[destino]}};
+            return {{caminho, custo: distancias[d]}};
         }}
         
         // Variáveis globais para controlar destaque
@@ -1003,68 +1526,141 @@ def criar_html_unificado(grafo, df_bairros, out_dir):
         let selectedEdgeKey = null;
         let selectedNodes = new Set();
         let eventosRegistrados = false;
+        let tracosDestaqueCriados = false;
+        
+        // Trace com todas as arestas, o mesmo do grafo inicial (não muda entre redesenhos)
+        const tracoArestasBase = graficos['grafico1'].data[0];
+        
+        // Índice de cada aresta pela chave do par de nós (a primeira, se houver arestas paralelas)
+        const indiceAresta = new Map();
+        for (let i = 0; i < numArestas; i++) {{
+            const chave = makeEdgeKey(nos.id[ARESTAS_NOS[2 * i]], nos.id[ARESTAS_NOS[2 * i + 1]]);
+            if (!indiceAresta.has(chave)) indiceAresta.set(chave, i);
+        }}
+        
+        // Trace só com as arestas destacadas (poucas), desenhado por cima do trace base
+        function tracoArestasDestaque(indices, cor, largura) {{
+            const x = [], y = [], hover = [], custom = [];
+            indices.forEach(i => {{
+                const u = ARESTAS_NOS[2 * i];
+                const v = ARESTAS_NOS[2 * i + 1];
+                const edge = {{
+                    source: nos.id[u],
+                    target: nos.id[v],
+                    peso: arestas.peso[i],
+                    logradouro: arestas.logradouro[i],
+                    observacao: arestas.observacao[i]
+                }};
+                const obsText = edge.observacao && edge.observacao !== 'Sem observação' ? `<br>Obs: ${{edge.observacao}}` : '';
+                const hoverDetails = `${{edge.source}} ↔ ${{edge.target}}<br>${{edge.logradouro}}<br>Peso: ${{edge.peso.toFixed(2)}}${{obsText}}`;
+                const payload = {{kind: 'edge', ...edge}};
+                x.push(nos.x[u], nos.x[v], null);
+                y.push(nos.y[u], nos.y[v], null);
+                hover.push(hoverDetails, hoverDetails, null);
+                custom.push(payload, payload, null);
+            }});
+            
+            return {{
+                type: 'scattergl',
+                x: x,
+                y: y,
+                mode: 'lines',
+                line: {{width: largura, color: cor}},
+                opacity: 1.0,
+                hoverinfo: 'text',
+                hovertext: hover,
+                customdata: custom,
+                showlegend: false
+            }};
+        }}
+        
+        // Trace só com os nós destacados, desenhado por cima do trace base dos nós.
+        // Os nomes aparecem aqui quando o trace base não mostra rótulos (grafos grandes).
+        function tracoNosDestaque() {{
+            const x = [], y = [], texto = [], hover = [], cores = [], tamanhos = [];
+            const adicionar = (id, cor, acrescimo) => {{
+                const i = indiceNo.get(id);
+                if (i === undefined) return;
+                x.push(nos.x[i]);
+                y.push(nos.y[i]);
+                texto.push(id);
+                hover.push(nodeHover[i]);
+                cores.push(cor);
+                tamanhos.push(nos.grau[i] * 6 + acrescimo);
+            }};
+            highlightedNodes.forEach(id => {{
+                if (!selectedNodes.has(id)) adicionar(id, PALETA.alerta, 20);
+            }});
+            selectedNodes.forEach(id => adicionar(id, PALETA.destaque, 24));
+            
+            return {{
+                type: 'scattergl',
+                x: x,
+                y: y,
+                mode: numNos <= LIMITE_ROTULOS ? 'markers' : 'markers+text',
+                text: texto,
+                textposition: 'top center',
+                textfont: {{
+                    size: 8,
+                    color: PALETA.texto,
+                    family: 'Arial Black'
+                }},
+                marker: {{
+                    size: tamanhos,
+                    color: cores,
+                    line: {{
+                        width: 2,
+                        color: PALETA.bg
+                    }}
+                }},
+                hoverinfo: 'text',
+                hovertext: hover,
+                showlegend: false
+            }};
+        }}
         
         // Função para redesenhar o grafo com destaques
         function redesenharGrafo() {{
             const graficoOriginal = graficos['grafico1'];
-            const novasTraces = [];
             
-            // Redesenhar arestas
-            edgesData.forEach(edge => {{
-                const edgeKey = makeEdgeKey(edge.source, edge.target);
-                const isPath = highlightedEdges.has(edgeKey);
-                const isSelected = selectedEdgeKey === edgeKey;
-                const isHighlighted = isPath || isSelected;
-                const obsText = edge.observacao && edge.observacao !== 'Sem observação' ? `<br>Obs: ${{edge.observacao}}` : '';
-                const hoverDetails = `${{edge.source}} ↔ ${{edge.target}}<br>${{edge.logradouro}}<br>Peso: ${{edge.peso.toFixed(2)}}${{obsText}}`;
-                const payload = {{
-                    kind: 'edge',
-                    source: edge.source,
-                    target: edge.target,
-                    peso: edge.peso,
-                    logradouro: edge.logradouro,
-                    observacao: edge.observacao
-                }};
-                
-                novasTraces.push({{
-                    type: 'scatter',
-                    x: [edge.x0, edge.x1, null],
-                    y: [edge.y0, edge.y1, null],
-                    mode: 'lines',
-                    line: {{
-                        width: isSelected ? 6 : (isPath ? 5 : 1.5),
-                        color: isSelected ? PALETA.destaque : (isPath ? PALETA.alerta : PALETA.texto_sec)
-                    }},
-                    opacity: isHighlighted ? 1.0 : 0.85,
-                    hoverinfo: 'text',
-                    hovertext: hoverDetails,
-                    customdata: [payload, payload, payload],
-                    showlegend: false
-                }});
+            // Redesenhar arestas: trace base + destaques do percurso e da aresta selecionada
+            const selecionada = indiceAresta.has(selectedEdgeKey) ? [indiceAresta.get(selectedEdgeKey)] : [];
+            const percurso = [];
+            highlightedEdges.forEach(chave => {{
+                if (chave !== selectedEdgeKey && indiceAresta.has(chave)) percurso.push(indiceAresta.get(chave));
             }});
+            const destaquePercurso = tracoArestasDestaque(percurso, PALETA.alerta, 5);
+            const destaqueSelecionada = tracoArestasDestaque(selecionada, PALETA.destaque, 6);
             
-            // Redesenhar nós
-            const nodeX = nodesData.map(n => n.x);
-            const nodeY = nodesData.map(n => n.y);
-            const nodeText = nodesData.map(n => n.id);
-            const nodeColors = nodesData.map(n => {{
-                if (selectedNodes.has(n.id)) return PALETA.destaque;
-                if (highlightedNodes.has(n.id)) return PALETA.alerta;
-                return n.grau > 7 ? PALETA.primario : (n.grau > 3 ? PALETA.secundario : PALETA.terciario);
-            }});
-            const nodeSizes = nodesData.map(n => {{
-                if (selectedNodes.has(n.id)) return n.grau * 6 + 24;
-                if (highlightedNodes.has(n.id)) return n.grau * 6 + 20;
-                return n.grau * 3 + 12;
-            }});
-            const nodeHover = nodesData.map(n => `<b>${{n.id}}</b><br>Grau: ${{n.grau}}<br>Densidade: ${{n.densidade.toFixed(3)}}`);
+            const destaqueNos = tracoNosDestaque();
+            
+            // Traces base já montados: só os traces de destaque (pequenos) mudam
+            if (tracosDestaqueCriados) {{
+                Plotly.restyle('grafico1', {{
+                    x: [destaquePercurso.x, destaqueSelecionada.x],
+                    y: [destaquePercurso.y, destaqueSelecionada.y],
+                    hovertext: [destaquePercurso.hovertext, destaqueSelecionada.hovertext],
+                    customdata: [destaquePercurso.customdata, destaqueSelecionada.customdata]
+                }}, [1, 2]);
+                Plotly.restyle('grafico1', {{
+                    x: [destaqueNos.x],
+                    y: [destaqueNos.y],
+                    text: [destaqueNos.text],
+                    hovertext: [destaqueNos.hovertext],
+                    'marker.color': [destaqueNos.marker.color],
+                    'marker.size': [destaqueNos.marker.size]
+                }}, [4]);
+                return;
+            }}
             
+            // Nós: trace base com as cores/tamanhos por grau (não muda) + trace dos nós destacados
+            const novasTraces = [tracoArestasBase, destaquePercurso, destaqueSelecionada];
             novasTraces.push({{
-                type: 'scatter',
-                x: nodeX,
-                y: nodeY,
-                mode: 'markers+text',
-                text: nodeText,
+                type: 'scattergl',
+                x: nos.x,
+                y: nos.y,
+                mode: numNos <= LIMITE_ROTULOS ? 'markers+text' : 'markers',
+                text: nos.id,
                 textposition: 'top center',
                 textfont: {{
                     size: 8,
@@ -1072,8 +1668,8 @@ def criar_html_unificado(grafo, df_bairros, out_dir):
                     family: 'Arial Black'
                 }},
                 marker: {{
-                    size: nodeSizes,
-                    color: nodeColors,
+                    size: nos.tamanho,
+                    color: coresBase,
                     line: {{
                         width: 2,
                         color: PALETA.bg
@@ -1083,8 +1679,10 @@ def criar_html_unificado(grafo, df_bairros, out_dir):
                 hovertext: nodeHover,
                 showlegend: false
             }});
+            novasTraces.push(destaqueNos);
             
             Plotly.react('grafico1', novasTraces, graficoOriginal.layout);
+            tracosDestaqueCriados = true;
         }}
         
         function mostrarInfoAresta(edge) {{
@@ -1158,7 +1756,7 @@ def criar_html_unificado(grafo, df_bairros, out_dir):
                 return;
             }}
             
-            const resultado = dijkstra(grafoAdjacencia, origem, destino);
+            const resultado = PRED ? reconstruirCaminho(origem, destino) : dijkstra(origem, destino);
             
             if (resultado.caminho) {{
                 highlightedNodes = new Set(resultado.caminho);
@@ -1174,12 +1772,9 @@ def criar_html_unificado(grafo, df_bairros, out_dir):
                 // Buscar logradouros
                 const logradouros = [];
                 for (let i = 0; i < resultado.caminho.length - 1; i++) {{
-                    const edge = edgesData.find(e => 
-                        (e.source === resultado.caminho[i] && e.target === resultado.caminho[i+1]) ||
-                        (e.target === resultado.caminho[i] && e.source === resultado.caminho[i+1])
-                    );
-                    if (edge && edge.logradouro !== 'Sem informação') {{
-                        logradouros.push(`${{i+1}}. ${{edge.logradouro}}`);
+                    const k = indiceAresta.get(makeEdgeKey(resultado.caminho[i], resultado.caminho[i + 1]));
+                    if (k !== undefined && arestas.logradouro[k] !== 'Sem informação') {{
+                        logradouros.push(`${{i+1}}. ${{arestas.logradouro[k]}}`);
                     }}
                 }}
                 
@@ -1266,24 +1861,71 @@ def criar_html_unificado(grafo, df_bairros, out_dir):
     with open(arquivo, 'w', encoding='utf-8') as f:
         f.write(html)
     
+    # Cópia comprimida para servir com Content-Encoding: gzip (o JSON embutido comprime bem);
+    # mtime=0 mantém o .gz idêntico entre execuções com o mesmo conteúdo
+    with gzip.GzipFile(arquivo + '.gz', 'wb', compresslevel=9, mtime=0) as f:
+        f.write(html.encode('utf-8'))
+    
     print(f"\n→ Dashboard único gerado: {arquivo}")
+    print(f"→ Versão comprimida: {arquivo}.gz ({os.path.getsize(arquivo + '.gz') / 1024:.0f} KB)")
     return arquivo
 
 
+def coordenadas_segmentos(pos, arestas):
+    """
+    Monta as listas x/y de um trace de linhas com um segmento por aresta.
+    
+    Cada aresta (u, v, ...) vira três pontos (u, v, NaN) num array (E, 3, 2)
+    preenchido por indexação do numpy, no lugar de um extend por aresta. O
+    NaN separa os segmentos e sai como null no JSON da figura, igual ao None.
+    
+    Args:
+        pos: Dicionário {nó: (x, y)}
+        arestas: Iterável de tuplas cujos dois primeiros itens são os nós
+        
+    Returns:
+        Tupla (xs, ys) de listas com 3 entradas por aresta
+    """
+    indice = {no: i for i, no in enumerate(pos)}
+    coords = np.asarray(list(pos.values()), dtype=float).reshape(-1, 2)
+    extremidades = np.fromiter((indice[no] for aresta in arestas for no in aresta[:2]), dtype=np.intp).reshape(-1, 2)
+    
+    segmentos = np.full((len(extremidades), 3, 2), np.nan)
+    segmentos[:, 0] = coords[extremidades[:, 0]]
+    segmentos[:, 1] = coords[extremidades[:, 1]]
+    return segmentos[..., 0].ravel().tolist(), segmentos[..., 1].ravel().tolist()
+
+
+def coordenadas_nos(pos, nos):
+    """
+    Monta as listas x/y dos nós a partir de um único array (N, 2) de posições.
+    
+    Args:
+        pos: Dicionário {nó: (x, y)}
+        nos: Lista de nós, na ordem do trace
+        
+    Returns:
+        Tupla (xs, ys) de listas de floats
+    """
+    coords = np.asarray([pos[no] for no in nos], dtype=float).reshape(-1, 2)
+    return coords[:, 0].tolist(), coords[:, 1].tolist()
+
+
 def criar_grafo_principal(grafo, pos, graus, densidades, micro_dict):
     """
     Cria os dados do grafo principal interativo.
     
-    Cada aresta é renderizada separadamente para permitir informações
-    individuais ao passar o mouse (hover). Os nós são coloridos de acordo
-    com seu grau de conectividade.
+    Todas as arestas vão num único trace (segmentos separados por None), com
+    hover e dados de clique individuais por ponto, o que evita um trace do
+    Plotly por aresta. Os traces usam scattergl (WebGL) para que pan, zoom e
+    hover continuem fluidos em redes grandes; acima de LIMITE_ROTULOS nós os
+    nomes dos bairros deixam de ser desenhados. Os nós são coloridos de
+    acordo com seu grau de conectividade.
     """
-    # Criar traces individuais para cada aresta (permite hover individual)
-    edge_traces = []
+    # Um único trace para todas as arestas; hover/customdata por ponto mantêm o detalhe de cada aresta
+    edge_x, edge_y = coordenadas_segmentos(pos, grafo.edges())
+    edge_hover, edge_custom = [], []
     for u, v, peso, meta in grafo.edges():
-        x0, y0 = pos[u]
-        x1, y1 = pos[v]
-        
         # Informações da aresta
         logradouro = normalizar_texto(getattr(meta, 'logradouro', None), 'Sem informação')
         observacao = normalizar_texto(getattr(meta, 'observacao', None), 'Sem observação')
@@ -1303,37 +1945,36 @@ def criar_grafo_principal(grafo, pos, graus, densidades, micro_dict):
         if tem_observacao:
             hover_text += f"Obs: {observacao}"
         
-        edge_trace = go.Scatter(
-            x=[x0, x1],
-            y=[y0, y1],
-            mode='lines',
-            line=dict(width=1.5, color=PALETA['texto_sec']),
-            hoverinfo='text',
-            hovertext=hover_text,
-            hoverlabel=dict(
-                bgcolor=PALETA['paper'],
-                font=dict(size=12, color=PALETA['texto']),
-                bordercolor=PALETA['primario']
-            ),
-            showlegend=False,
-            opacity=0.85
-        )
-        edge_trace.update(customdata=[edge_payload, edge_payload])
-        edge_traces.append(edge_trace)
+        edge_hover.extend([hover_text, hover_text, None])
+        edge_custom.extend([edge_payload, edge_payload, None])
+    
+    edge_trace = go.Scattergl(
+        x=edge_x,
+        y=edge_y,
+        mode='lines',
+        line=dict(width=1.5, color=PALETA['texto_sec']),
+        hoverinfo='text',
+        hovertext=edge_hover,
+        hoverlabel=dict(
+            bgcolor=PALETA['paper'],
+            font=dict(size=12, color=PALETA['texto']),
+            bordercolor=PALETA['primario']
+        ),
+        customdata=edge_custom,
+        showlegend=False,
+        opacity=0.85
+    )
     
     # Nós
-    node_x, node_y, node_text, node_color = [], [], [], []
-    for no in grafo.nodes():
-        x, y = pos[no]
-        node_x.append(x)
-        node_y.append(y)
-        grau = graus[no]
-        node_text.append(f"<b>{no}</b><br>Grau: {grau}<br>Densidade ego: {densidades[no]:.3f}<br>RPA: {micro_dict.get(no, 'N/A')}")
-        node_color.append(grau)
+    nos = grafo.nodes()
+    node_x, node_y = coordenadas_nos(pos, nos)
+    node_color = [graus[no] for no in nos]
+    node_text = [f"<b>{no}</b><br>Grau: {graus[no]}<br>Densidade ego: {densidades[no]:.3f}<br>RPA: {micro_dict.get(no, 'N/A')}"
+                 for no in nos]
     
-    node_trace = go.Scatter(
+    node_trace = go.Scattergl(
         x=node_x, y=node_y,
-        mode='markers+text',
+        mode='markers+text' if len(node_x) <= LIMITE_ROTULOS else 'markers',
         text=[no for no in grafo.nodes()],  # Mostrar TODOS os nomes dos bairros
         textposition='top center',
         textfont=dict(size=8, color=PALETA['texto'], family='Arial Black'),
@@ -1378,19 +2019,14 @@ def criar_grafo_principal(grafo, pos, graus, densidades, micro_dict):
         )
     )
     
-    return {'data': edge_traces + [node_trace], 'layout': layout}
+    return {'data': [edge_trace, node_trace], 'layout': layout}
 
 
 def criar_mapa_calor_grau(grafo, pos, graus):
-    """Cria mapa de calor por grau"""
-    edge_x, edge_y = [], []
-    for u, v, peso, meta in grafo.edges():
-        x0, y0 = pos[u]
-        x1, y1 = pos[v]
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
+    """Cria mapa de calor por grau (traces scattergl, como no grafo principal)"""
+    edge_x, edge_y = coordenadas_segmentos(pos, grafo.edges())
     
-    edge_trace = go.Scatter(
+    edge_trace = go.Scattergl(
         x=edge_x, y=edge_y,
         mode='lines',
         line=dict(width=0.5, color=PALETA['texto_sec']),
@@ -1399,19 +2035,23 @@ def criar_mapa_calor_grau(grafo, pos, graus):
         showlegend=False
     )
     
-    node_x, node_y, node_text, node_size = [], [], [], []
-    for no in grafo.nodes():
-        x, y = pos[no]
-        node_x.append(x)
-        node_y.append(y)
-        grau = graus[no]
-        node_text.append(f"{no}<br>Conexões: {grau}")
-        node_size.append(grau * 3 + 10)
+    nos = grafo.nodes()
+    node_x, node_y = coordenadas_nos(pos, nos)
+    node_text = [f"{no}<br>Conexões: {graus[no]}" for no in nos]
+    node_size = [graus[no] * 3 + 10 for no in nos]
     
-    node_trace = go.Scatter(
+    # Desenhar texto é o mais caro do scatter: em grafos maiores só os nós de
+    # grau mais alto ganham rótulo (o hover continua identificando todos)
+    if len(nos) <= LIMITE_ROTULOS_MAPA:
+        rotulos = nos
+    else:
+        corte = np.percentile([graus[no] for no in nos], 90)
+        rotulos = [no if graus[no] >= corte else '' for no in nos]
+    
+    node_trace = go.Scattergl(
         x=node_x, y=node_y,
-        mode='markers+text',
-        text=[no for no in grafo.nodes()],
+        mode='markers+text' if any(rotulos) else 'markers',
+        text=rotulos,
         textposition='top center',
         textfont=dict(size=8, color=PALETA['texto']),
         marker=dict(
@@ -1444,25 +2084,26 @@ def criar_top10_subgrafo(grafo, graus):
     """Cria subgrafo dos top 10 bairros"""
     from graphs.graph import Graph, EdgeMeta
     
-    top_bairros = sorted(graus.items(), key=lambda x: x[1], reverse=True)[:10]
+    top_bairros = heapq.nlargest(10, graus.items(), key=lambda x: x[1])
     top_nomes = {b for b, _ in top_bairros}
     
+    # Nós na ordem do ranking (layout reprodutível) e só as arestas incidentes
+    # aos 10 bairros, cada par uma vez, sem percorrer todas as arestas do grafo
     g_sub = Graph()
-    for bairro in top_nomes:
+    for bairro, _ in top_bairros:
         g_sub.add_node(bairro)
     
-    for u, v, peso, meta in grafo.edges():
-        if u in top_nomes and v in top_nomes:
-            g_sub.add_edge(u, v, peso, meta)
+    vistos = set()
+    for u, _ in top_bairros:
+        for v, peso, meta in grafo.neighbors(u):
+            if v in top_nomes and (u, v) not in vistos:
+                vistos.add((u, v))
+                vistos.add((v, u))
+                g_sub.add_edge(u, v, peso, meta)
     
     pos = circular_layout(g_sub)
     
-    edge_x, edge_y = [], []
-    for u, v, peso, meta in g_sub.edges():
-        x0, y0 = pos[u]
-        x1, y1 = pos[v]
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
+    edge_x, edge_y = coordenadas_segmentos(pos, g_sub.edges())
     
     edge_trace = go.Scatter(
         x=edge_x, y=edge_y,
@@ -1473,12 +2114,8 @@ def criar_top10_subgrafo(grafo, graus):
         showlegend=False
     )
     
-    node_x, node_y, node_text = [], [], []
-    for no in g_sub.nodes():
-        x, y = pos[no]
-        node_x.append(x)
-        node_y.append(y)
-        node_text.append(f"<b>{no}</b><br>Grau: {graus[no]}")
+    node_x, node_y = coordenadas_nos(pos, g_sub.nodes())
+    node_text = [f"<b>{no}</b><br>Grau: {graus[no]}" for no in g_sub.nodes()]
     
     node_trace = go.Scatter(
         x=node_x, y=node_y,
@@ -1540,35 +2177,23 @@ def criar_arvore_bfs(grafo, origem):
     """Cria árvore BFS"""
     pais = bfs_arvore(grafo, origem)
     
-    arestas_arvore = []
+    arestas_arvore = [(pai, filho) for filho, pai in pais.items() if pai is not None]
     niveis = {origem: 0}
-    
-    for filho, pai in pais.items():
-        if pai is not None:
-            arestas_arvore.append((pai, filho))
-            niveis[filho] = niveis[pai] + 1
+    for pai, filho in arestas_arvore:
+        niveis[filho] = niveis[pai] + 1
     
     # Layout hierárquico
-    pos = {}
     nivel_nos = {}
     for no, nivel in niveis.items():
-        if nivel not in nivel_nos:
-            nivel_nos[nivel] = []
-        nivel_nos[nivel].append(no)
+        nivel_nos.setdefault(nivel, []).append(no)
     
+    # Posições de cada nível calculadas de uma vez: x centralizado, y pela profundidade
+    pos = {}
     for nivel, nos in nivel_nos.items():
-        largura = len(nos)
-        for i, no in enumerate(nos):
-            x = (i - largura/2) * 2
-            y = -nivel * 2
-            pos[no] = (x, y)
-    
-    edge_x, edge_y = [], []
-    for u, v in arestas_arvore:
-        x0, y0 = pos[u]
-        x1, y1 = pos[v]
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
+        xs = (np.arange(len(nos)) - len(nos) / 2) * 2
+        pos.update(zip(nos, zip(xs.tolist(), [-nivel * 2.0] * len(nos))))
+    
+    edge_x, edge_y = coordenadas_segmentos(pos, arestas_arvore)
     
     edge_trace = go.Scatter(
         x=edge_x, y=edge_y,
@@ -1578,14 +2203,9 @@ def criar_arvore_bfs(grafo, origem):
         showlegend=False
     )
     
-    node_x, node_y, node_text, node_color = [], [], [], []
-    for no in niveis.keys():
-        x, y = pos[no]
-        node_x.append(x)
-        node_y.append(y)
-        nivel = niveis[no]
-        node_text.append(f"<b>{no}</b><br>Nível: {nivel}")
-        node_color.append(nivel)
+    node_x, node_y = coordenadas_nos(pos, list(niveis))
+    node_text = [f"<b>{no}</b><br>Nível: {nivel}" for no, nivel in niveis.items()]
+    node_color = list(niveis.values())
     
     node_trace = go.Scatter(
         x=node_x, y=node_y,
@@ -1620,68 +2240,64 @@ def criar_arvore_bfs(grafo, origem):
     return {'data': [edge_trace, node_trace], 'layout': layout}
 
 
-def criar_arvore_percurso(grafo, origem, destino, pos):
-    """Cria visualização do percurso"""
-    distancias, predecessores = dijkstra(grafo, origem)
-    caminho = reconstruir_caminho(predecessores, destino)
+def criar_arvore_percurso(grafo, origem, destino, pos, rota=None):
+    """
+    Cria visualização do percurso.
     
-    # Arestas (todas)
-    edge_x, edge_y, edge_colors, edge_widths = [], [], [], []
+    rota é a tupla (custo, caminho) já calculada, p.ex. por rota_da_tabela;
+    sem ela o percurso sai de um Dijkstra a partir da origem. Arestas e nós
+    cobrem o grafo inteiro, então os traces usam scattergl (WebGL).
+    """
+    if rota is None:
+        distancias, predecessores = dijkstra(grafo, origem)
+        rota = (distancias[destino], reconstruir_caminho(predecessores, destino))
+    custo, caminho = rota
+    
+    # Arestas: coordenadas separadas em duas listas (fora e dentro do caminho),
+    # uma trace para cada, em vez de uma trace por aresta
+    arestas_caminho = {frozenset(par) for par in zip(caminho, caminho[1:])}
+    fundo, no_caminho = [], []
     for u, v, peso, meta in grafo.edges():
-        x0, y0 = pos[u]
-        x1, y1 = pos[v]
-        
-        eh_caminho = False
-        for i in range(len(caminho) - 1):
-            if (caminho[i] == u and caminho[i+1] == v) or (caminho[i] == v and caminho[i+1] == u):
-                eh_caminho = True
-                break
-        
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
-        edge_colors.append(PALETA['alerta'] if eh_caminho else PALETA['texto_sec'])
-        edge_widths.append(4 if eh_caminho else 0.5)
-    
-    # Criar múltiplos traces para diferentes larguras
-    edge_traces = []
-    idx = 0
-    for i in range(0, len(edge_x), 3):
-        edge_traces.append(go.Scatter(
-            x=edge_x[i:i+3],
-            y=edge_y[i:i+3],
+        (no_caminho if frozenset((u, v)) in arestas_caminho else fundo).append((u, v))
+    fundo_x, fundo_y = coordenadas_segmentos(pos, fundo)
+    caminho_x, caminho_y = coordenadas_segmentos(pos, no_caminho)
+    
+    edge_traces = [
+        go.Scattergl(
+            x=fundo_x, y=fundo_y,
+            mode='lines',
+            line=dict(width=0.5, color=PALETA['texto_sec']),
+            hoverinfo='none',
+            showlegend=False,
+            opacity=0.2
+        ),
+        go.Scattergl(
+            x=caminho_x, y=caminho_y,
             mode='lines',
-            line=dict(width=edge_widths[idx], color=edge_colors[idx]),
+            line=dict(width=4, color=PALETA['alerta']),
             hoverinfo='none',
             showlegend=False,
-            opacity=1.0 if edge_widths[idx] > 1 else 0.2
-        ))
-        idx += 1
+            opacity=1.0
+        ),
+    ]
+    
+    # Nós: classe de cada nó indexa a tabela de estilos (cor, tamanho, rótulo)
+    estilos = (
+        (PALETA['sucesso'], 25, "<b>ORIGEM</b><br>{}"),
+        (PALETA['erro'], 25, "<b>DESTINO</b><br>{}"),
+        (PALETA['alerta'], 18, "<b>{}</b><br>No caminho"),
+        (PALETA['texto_sec'], 8, "{}"),
+    )
+    nos_caminho = set(caminho)
     
-    # Nós
-    node_x, node_y, node_text, node_color, node_size = [], [], [], [], []
-    for no in grafo.nodes():
-        x, y = pos[no]
-        node_x.append(x)
-        node_y.append(y)
-        
-        if no == origem:
-            node_color.append(PALETA['sucesso'])
-            node_size.append(25)
-            node_text.append(f"<b>ORIGEM</b><br>{no}")
-        elif no == destino:
-            node_color.append(PALETA['erro'])
-            node_size.append(25)
-            node_text.append(f"<b>DESTINO</b><br>{no}")
-        elif no in caminho:
-            node_color.append(PALETA['alerta'])
-            node_size.append(18)
-            node_text.append(f"<b>{no}</b><br>No caminho")
-        else:
-            node_color.append(PALETA['texto_sec'])
-            node_size.append(8)
-            node_text.append(no)
+    nos = grafo.nodes()
+    node_x, node_y = coordenadas_nos(pos, nos)
+    classes = [0 if no == origem else 1 if no == destino else 2 if no in nos_caminho else 3 for no in nos]
+    node_color = [estilos[classe][0] for classe in classes]
+    node_size = [estilos[classe][1] for classe in classes]
+    node_text = [estilos[classe][2].format(no) for no, classe in zip(nos, classes)]
     
-    node_trace = go.Scatter(
+    node_trace = go.Scattergl(
         x=node_x, y=node_y,
         mode='markers',
         marker=dict(
@@ -1695,7 +2311,7 @@ def criar_arvore_percurso(grafo, origem, destino, pos):
     )
     
     layout = go.Layout(
-        title=dict(text=f'Percurso: {origem} → {destino} (Custo: {distancias[destino]:.1f})', 
+        title=dict(text=f'Percurso: {origem} → {destino} (Custo: {custo:.1f})', 
                    font=dict(size=16, color=PALETA['texto'])),
         showlegend=False,
         hovermode='closest',
@@ -1712,21 +2328,23 @@ def criar_arvore_percurso(grafo, origem, destino, pos):
 
 def criar_ranking_densidade(densidades, micro_dict):
     """Cria ranking de densidade de ego-network"""
-    top_20 = sorted(densidades.items(), key=lambda x: x[1], reverse=True)[:20]
+    top_20 = heapq.nlargest(20, densidades.items(), key=lambda x: x[1])
     bairros = [b for b, _ in top_20]
     valores = [d for _, d in top_20]
     cores = [PALETA['primario'] if micro_dict.get(b) in ['1', '2'] else PALETA['secundario'] for b in bairros]
+    # Cada densidade é formatada uma vez e usada no rótulo da barra e no hover
+    textos = [f'{v:.3f}' for v in valores]
     
     trace = go.Bar(
         y=bairros,
         x=valores,
         orientation='h',
         marker=dict(color=cores),
-        text=[f'{v:.3f}' for v in valores],
+        text=textos,
         textposition='outside',
         hoverinfo='text',
-        hovertext=[f"<b>{b}</b><br>Densidade: {v:.3f}<br>RPA: {micro_dict.get(b, 'N/A')}" 
-                   for b, v in zip(bairros, valores)]
+        hovertext=[f"<b>{b}</b><br>Densidade: {t}<br>RPA: {micro_dict.get(b, 'N/A')}" 
+                   for b, t in zip(bairros, textos)]
     )
     
     layout = go.Layout(
@@ -1744,8 +2362,14 @@ def criar_ranking_densidade(densidades, micro_dict):
     return {'data': [trace], 'layout': layout}
 
 
-def main():
-    """Função principal"""
+def main(estatico=False):
+    """
+    Função principal.
+    
+    Args:
+        estatico: Gera a versão estática do dashboard (imagens PNG, sem
+            interatividade) em vez do HTML interativo
+    """
     data_dir = os.path.join(ROOT_DIR, 'data')
     out_dir = os.path.join(ROOT_DIR, 'out')
     os.makedirs(out_dir, exist_ok=True)
@@ -1758,23 +2382,21 @@ def main():
     grafo = carregar_adjacencias(bairros_csv, adj_csv)
     print(f"→ Grafo carregado: {grafo.order()} nós, {grafo.size()} arestas")
     
-    arquivo = criar_html_unificado(grafo, df_bairros, out_dir)
-    
-    print("\n" + "="*70)
-    print("DASHBOARD ÚNICO GERADO COM SUCESSO")
-    print("="*70)
-    print(f"\nArquivo: {arquivo}")
-    print("\nVisualizações incluídas:")
-    print("  1. Grafo Principal Interativo")
-    print("  2. Mapa de Calor por Grau")
-    print("  3. Top 10 Bairros Mais Conectados")
-    print("  4. Distribuição de Graus")
-    print("  5. Árvore BFS (Boa Vista)")
-    print("  6. Percurso Nova Descoberta → Boa Viagem")
-    print("  7. Ranking de Densidade")
-    print("\nTodas as visualizações em um único HTML com sistema de abas")
-    print("="*70 + "\n")
+    arquivo = criar_html_unificado(grafo, df_bairros, out_dir, estatico=estatico)
+    
+    linhas = [
+        "\n" + "="*70,
+        "DASHBOARD ÚNICO GERADO COM SUCESSO",
+        "="*70,
+        f"\nArquivo: {arquivo}",
+        "\nVisualizações incluídas:",
+        *(f"  {i}. {titulo}" for i, (_, titulo) in enumerate(TITULOS_PAINEIS, start=1)),
+        "\nTodas as visualizações em um único HTML com sistema de abas" if not estatico
+        else "\nVisualizações pré-renderizadas em PNG (somente leitura)",
+        "="*70 + "\n",
+    ]
+    sys.stdout.write("\n".join(linhas) + "\n")
 
 
 if __name__ == "__main__":
-    main()
+    main(estatico='--estatico' in sys.argv[1:])
@@ -1,29 +1,191 @@
 from collections import deque, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Tuple, Set
+from weakref import WeakValueDictionary
 import heapq
+import math
+import os
 from graphs.graph import Graph
 
+try:
+    import numpy as np
+except ImportError:  # numpy é opcional: sem ele a BFS por níveis roda em Python puro
+    np = None
+
+
+# Acima deste número de nós, bfs expande a fronteira nível a nível (bfs_niveis)
+LIMITE_BFS_NIVEIS = 50000
+
+# Acima deste total de origens × arestas, dijkstra_varias_origens usa um pool de processos
+LIMITE_DIJKSTRA_PARALELO = 2_000_000
+
+# Acima deste número de arestas, densidades_ego divide os nós entre um pool de processos
+LIMITE_DENSIDADES_PARALELO = 200_000
+
+# Pesos inteiros até este valor fazem dijkstra_indices usar a fila de baldes (Dial)
+LIMITE_PESO_BALDES = 1000
+
+# Grafos consultados por caminho_minimo, por id; o cache guarda só o id e a versão
+_grafos_registrados = WeakValueDictionary()
+
 
 def bfs(grafo: Graph, origem: str) -> Dict[str, int]:
     """
     Busca em largura (BFS) a partir de um nó origem.
     Retorna um dicionário com as distâncias (em número de arestas) de cada nó até a origem.
+    
+    Percorre a representação CSR do grafo (Graph.to_csr) com índices inteiros;
+    a fila é uma lista com ponteiro de cabeça e os visitados ficam num
+    bytearray (um byte por nó).
     """
-    if origem not in grafo.nodes():
+    indptr, indices, _, id2name, name2id = grafo.to_csr()
+    s = name2id.get(origem)
+    if s is None:
         return {}
     
-    distancias = {origem: 0}
-    fila = deque([origem])
+    n = len(id2name)
+    if n > LIMITE_BFS_NIVEIS:
+        return bfs_niveis(grafo, origem)
     
-    while fila:
-        atual = fila.popleft()
-        dist_atual = distancias[atual]
+    visitados = bytearray(n)
+    visitados[s] = 1
+    distancias = [0] * n
+    fila = [s]
+    cabeca = 0
+    
+    while cabeca < len(fila):
+        atual = fila[cabeca]
+        cabeca += 1
+        dist_vizinho = distancias[atual] + 1
         
-        for vizinho, _, _ in grafo.neighbors(atual):
-            if vizinho not in distancias:
-                distancias[vizinho] = dist_atual + 1
+        for vizinho in indices[indptr[atual]:indptr[atual + 1]]:
+            if not visitados[vizinho]:
+                visitados[vizinho] = 1
+                distancias[vizinho] = dist_vizinho
                 fila.append(vizinho)
     
+    return {id2name[no]: distancias[no] for no in fila}
+
+
+def _listas_vizinhos(indptr, indices, nos):
+    """Concatena (com numpy) as listas de vizinhos dos nós dados; retorna também o tamanho de cada lista."""
+    inicio = indptr[nos]
+    quantidade = indptr[nos + 1] - inicio
+    total = int(quantidade.sum())
+    posicoes = np.repeat(inicio - (np.cumsum(quantidade) - quantidade), quantidade) + np.arange(total)
+    return indices[posicoes], quantidade
+
+
+def bfs_niveis(grafo: Graph, origem: str, alfa: float = 14, beta: float = 24) -> Dict[str, int]:
+    """
+    BFS síncrona por níveis, com troca de direção (push/pull) de Beamer.
+    
+    Cada nível é montado de uma vez, em uma de duas direções:
+      - top-down: junta as listas de vizinhos da fronteira e fica com os
+        ainda não visitados;
+      - bottom-up: cada nó não visitado procura, entre seus vizinhos, algum
+        que esteja na fronteira.
+    Começa top-down e passa para bottom-up quando as arestas que saem da
+    fronteira superam 1/alfa das arestas dos nós não visitados (fronteira
+    grande, típico do meio da busca numa componente gigante); volta para
+    top-down quando a fronteira cai abaixo de n/beta nós. Com numpy cada
+    nível é uma operação vetorizada sobre o CSR; sem ele, laços em Python.
+    
+    Args:
+        grafo: Grafo a percorrer
+        origem: Nó de partida
+        alfa: Limiar para passar para bottom-up
+        beta: Limiar para voltar para top-down
+    
+    Returns:
+        As mesmas distâncias de bfs; as chaves ficam em ordem de nível e,
+        dentro de cada nível, em ordem alfabética
+    """
+    indptr, indices, _, id2name, name2id = grafo.to_csr()
+    s = name2id.get(origem)
+    if s is None:
+        return {}
+    
+    n = len(id2name)
+    distancias = {origem: 0}
+    nivel = 0
+    bottom_up = False
+    
+    if np is not None:
+        indptr = np.frombuffer(indptr, dtype=np.intc)
+        indices = np.frombuffer(indices, dtype=np.intc)
+        grau = np.diff(indptr)
+        arestas_nao_visitadas = int(grau.sum() - grau[s])
+        visitados = np.zeros(n, dtype=np.bool_)
+        visitados[s] = True
+        fronteira = np.array([s], dtype=np.intc)
+        
+        while fronteira.size:
+            nivel += 1
+            arestas_fronteira = int(grau[fronteira].sum())
+            if not bottom_up and arestas_fronteira > arestas_nao_visitadas / alfa:
+                bottom_up = True
+            elif bottom_up and fronteira.size < n / beta:
+                bottom_up = False
+            
+            if bottom_up:
+                em_fronteira = np.zeros(n, dtype=np.bool_)
+                em_fronteira[fronteira] = True
+                candidatos = np.flatnonzero(~visitados)
+                vizinhos, quantidade = _listas_vizinhos(indptr, indices, candidatos)
+                dono = np.repeat(np.arange(candidatos.size), quantidade)
+                fronteira = candidatos[np.unique(dono[em_fronteira[vizinhos]])]
+            else:
+                vizinhos, _ = _listas_vizinhos(indptr, indices, fronteira)
+                fronteira = np.unique(vizinhos[~visitados[vizinhos]])
+            
+            visitados[fronteira] = True
+            arestas_nao_visitadas -= int(grau[fronteira].sum())
+            for no in fronteira.tolist():
+                distancias[id2name[no]] = nivel
+        
+        return distancias
+    
+    arestas_nao_visitadas = len(indices) - (indptr[s + 1] - indptr[s])
+    visitados = bytearray(n)
+    visitados[s] = 1
+    fronteira = [s]
+    
+    while fronteira:
+        nivel += 1
+        arestas_fronteira = sum(indptr[no + 1] - indptr[no] for no in fronteira)
+        if not bottom_up and arestas_fronteira > arestas_nao_visitadas / alfa:
+            bottom_up = True
+        elif bottom_up and len(fronteira) < n / beta:
+            bottom_up = False
+        
+        proxima = []
+        if bottom_up:
+            em_fronteira = bytearray(n)
+            for no in fronteira:
+                em_fronteira[no] = 1
+            for no in range(n):
+                if not visitados[no]:
+                    for vizinho in indices[indptr[no]:indptr[no + 1]]:
+                        if em_fronteira[vizinho]:
+                            proxima.append(no)
+                            break
+            for no in proxima:
+                visitados[no] = 1
+        else:
+            for atual in fronteira:
+                for vizinho in indices[indptr[atual]:indptr[atual + 1]]:
+                    if not visitados[vizinho]:
+                        visitados[vizinho] = 1
+                        proxima.append(vizinho)
+            proxima.sort()
+        
+        for no in proxima:
+            distancias[id2name[no]] = nivel
+            arestas_nao_visitadas -= indptr[no + 1] - indptr[no]
+        fronteira = proxima
+    
     return distancias
 
 
@@ -32,21 +194,32 @@ def bfs_arvore(grafo: Graph, origem: str) -> Dict[str, str]:
     Busca em largura (BFS) retornando a árvore de busca.
     Retorna um dicionário onde a chave é o nó e o valor é seu pai na árvore.
     """
-    if origem not in grafo.nodes():
+    indptr, indices, _, id2name, name2id = grafo.to_csr()
+    s = name2id.get(origem)
+    if s is None:
         return {}
     
-    pais = {origem: None}
-    fila = deque([origem])
+    n = len(id2name)
+    visitados = bytearray(n)
+    visitados[s] = 1
+    pais = [0] * n
+    fila = [s]
+    cabeca = 0
     
-    while fila:
-        atual = fila.popleft()
+    while cabeca < len(fila):
+        atual = fila[cabeca]
+        cabeca += 1
         
-        for vizinho, _, _ in grafo.neighbors(atual):
-            if vizinho not in pais:
+        for vizinho in indices[indptr[atual]:indptr[atual + 1]]:
+            if not visitados[vizinho]:
+                visitados[vizinho] = 1
                 pais[vizinho] = atual
                 fila.append(vizinho)
     
-    return pais
+    arvore = {origem: None}
+    for no in fila[1:]:
+        arvore[id2name[no]] = id2name[pais[no]]
+    return arvore
 
 
 def dfs(grafo: Graph, origem: str) -> Dict[str, int]:
@@ -55,65 +228,170 @@ def dfs(grafo: Graph, origem: str) -> Dict[str, int]:
     Retorna um dicionário com a ordem de visitação.
     
     Versão iterativa para suportar grafos grandes sem estourar recursão.
+    A pilha guarda índices inteiros da representação CSR (Graph.to_csr)
+    e os visitados ficam num bytearray.
     """
-    if origem not in grafo.nodes():
+    indptr, indices, _, id2name, name2id = grafo.to_csr()
+    s = name2id.get(origem)
+    if s is None:
         return {}
     
-    visitados = {}
-    pilha = [origem]
-    ordem = 0
+    visitados = bytearray(len(id2name))
+    ordem = []
+    pilha = [s]
     
     while pilha:
         no = pilha.pop()
         
-        if no in visitados:
+        if visitados[no]:
             continue
         
-        visitados[no] = ordem
-        ordem += 1
+        visitados[no] = 1
+        ordem.append(no)
         
         # Adiciona vizinhos à pilha (ordem reversa para manter ordem similar à recursiva)
-        vizinhos = [v for v, _, _ in grafo.neighbors(no)]
-        for vizinho in reversed(vizinhos):
-            if vizinho not in visitados:
+        for vizinho in reversed(indices[indptr[no]:indptr[no + 1]]):
+            if not visitados[vizinho]:
                 pilha.append(vizinho)
     
-    return visitados
+    return {id2name[no]: i for i, no in enumerate(ordem)}
 
 
-def dijkstra(grafo: Graph, origem: str) -> Tuple[Dict[str, float], Dict[str, str]]:
+@lru_cache(maxsize=32)
+def _peso_maximo_baldes(id_grafo: int, versao: int) -> int:
+    # Maior peso se todos forem inteiros em [1, LIMITE_PESO_BALDES]; 0 caso contrário
+    pesos = _grafos_registrados[id_grafo].to_csr()[2]
+    if not pesos:
+        return 0
+    menor, maior = min(pesos), max(pesos)
+    if not 1 <= menor <= maior <= LIMITE_PESO_BALDES:
+        return 0
+    if np is not None:
+        arr = np.asarray(pesos, dtype=float)
+        if not np.all(arr == np.floor(arr)):
+            return 0
+    elif not all(p == int(p) for p in pesos):
+        return 0
+    return int(maior)
+
+
+def _dijkstra_baldes(indptr, indices, pesos, n: int, s: int, c: int) -> Tuple[List[float], List[int]]:
+    # Fila de baldes monótona (Dial): c + 1 baldes circulares indexados pela distância.
+    # Com pesos >= 1 o balde d está completo ao ser alcançado; seus nós são fechados em
+    # ordem de índice, a mesma ordem (dist, nó) do heap, então pred sai idêntico.
+    dist = [math.inf] * n
+    dist[s] = 0.0
+    pred = [-1] * n
+    
+    nb = c + 1
+    baldes = [[] for _ in range(nb)]
+    baldes[0].append(s)
+    pendentes = 1
+    d = 0
+    
+    while pendentes:
+        balde = baldes[d % nb]
+        if balde:
+            pendentes -= len(balde)
+            fechados = sorted(u for u in balde if dist[u] == d)
+            balde.clear()
+            
+            for atual in fechados:
+                inicio, fim = indptr[atual], indptr[atual + 1]
+                for vizinho, peso in zip(indices[inicio:fim], pesos[inicio:fim]):
+                    nova_dist = d + peso
+                    
+                    if nova_dist < dist[vizinho]:
+                        dist[vizinho] = nova_dist
+                        pred[vizinho] = atual
+                        baldes[int(nova_dist) % nb].append(vizinho)
+                        pendentes += 1
+        d += 1
+    
+    return dist, pred
+
+
+def dijkstra_indices(grafo: Graph, s: int) -> Tuple[List[float], List[int]]:
     """
-    Algoritmo de Dijkstra para caminho mínimo com pesos não-negativos.
-    Retorna:
-        - Dicionário de distâncias mínimas
-        - Dicionário de predecessores para reconstruir o caminho
+    Dijkstra sobre os índices inteiros da representação CSR (Graph.to_csr).
+    
+    Distâncias, predecessores e a marca de fechados são listas de tamanho n
+    alocadas de uma vez; entradas velhas do heap são descartadas na retirada
+    (nó já fechado). A marca de fechados também garante o término com uma
+    aresta negativa (sem ela, u→v→u com peso negativo realimentaria o heap
+    para sempre), com o mesmo resultado da versão original por nome.
+    Se todos os pesos são inteiros entre 1 e LIMITE_PESO_BALDES, usa uma fila
+    de baldes (Dial) no lugar do heap: O(V + E + distância máxima).
+    
+    Args:
+        grafo: Grafo com pesos não-negativos
+        s: Índice CSR da origem
+    
+    Returns:
+        Tupla (dist, pred) indexada pelos índices CSR; pred é -1 na origem
+        e nos nós inalcançáveis
     """
-    if origem not in grafo.nodes():
-        return {}, {}
+    indptr, indices, pesos, id2name, _ = grafo.to_csr()
     
-    distancias = {no: float('inf') for no in grafo.nodes()}
-    distancias[origem] = 0.0
-    predecessores = {origem: None}
+    n = len(id2name)
+    
+    _grafos_registrados[id(grafo)] = grafo
+    c = _peso_maximo_baldes(id(grafo), grafo.versao)
+    if c:
+        return _dijkstra_baldes(indptr, indices, pesos, n, s, c)
+    
+    dist = [math.inf] * n
+    dist[s] = 0.0
+    pred = [-1] * n
+    fechado = bytearray(n)
     
-    heap = [(0.0, origem)]
-    visitados = set()
+    heap = [(0.0, s)]
     
     while heap:
         dist_atual, atual = heapq.heappop(heap)
         
-        if atual in visitados:
+        if fechado[atual]:
             continue
+        fechado[atual] = 1
         
-        visitados.add(atual)
-        
-        for vizinho, peso, _ in grafo.neighbors(atual):
-            if vizinho not in visitados:
-                nova_dist = dist_atual + peso
-                
-                if nova_dist < distancias[vizinho]:
-                    distancias[vizinho] = nova_dist
-                    predecessores[vizinho] = atual
-                    heapq.heappush(heap, (nova_dist, vizinho))
+        inicio, fim = indptr[atual], indptr[atual + 1]
+        for vizinho, peso in zip(indices[inicio:fim], pesos[inicio:fim]):
+            if fechado[vizinho]:
+                continue
+            nova_dist = dist_atual + peso
+            
+            if nova_dist < dist[vizinho]:
+                dist[vizinho] = nova_dist
+                pred[vizinho] = atual
+                heapq.heappush(heap, (nova_dist, vizinho))
+    
+    return dist, pred
+
+
+def dijkstra(grafo: Graph, origem: str) -> Tuple[Dict[str, float], Dict[str, str]]:
+    """
+    Algoritmo de Dijkstra para caminho mínimo com pesos não-negativos.
+    Retorna:
+        - Dicionário de distâncias mínimas
+        - Dicionário de predecessores para reconstruir o caminho
+    
+    Roda dijkstra_indices sobre a representação CSR do grafo e só converte
+    o resultado para dicionários por nome no final. Como os índices seguem
+    a ordem alfabética dos nós, os empates no heap são resolvidos como na
+    versão por nome.
+    """
+    _, _, _, id2name, name2id = grafo.to_csr()
+    s = name2id.get(origem)
+    if s is None:
+        return {}, {}
+    
+    dist, pred = dijkstra_indices(grafo, s)
+    
+    distancias = {no: dist[i] for no, i in name2id.items()}
+    predecessores = {origem: None}
+    for i, p in enumerate(pred):
+        if p >= 0:
+            predecessores[id2name[i]] = id2name[p]
     
     return distancias, predecessores
 
@@ -125,38 +403,157 @@ def bellman_ford(grafo: Graph, origem: str) -> Tuple[Dict[str, float], Dict[str,
         - Dicionário de distâncias mínimas
         - Dicionário de predecessores
         - Bool indicando se há ciclo negativo
+    
+    As arestas vêm de Graph.edges_soa (arrays de índices e pesos) e as
+    distâncias ficam numa lista indexada por inteiro. Uma rodada sem nenhuma
+    relaxação encerra o laço mais cedo: as seguintes também não mudariam
+    nada e não há ciclo negativo alcançável.
     """
-    if origem not in grafo.nodes():
+    _, _, _, id2name, name2id = grafo.to_csr()
+    s = name2id.get(origem)
+    if s is None:
         return {}, {}, False
     
-    distancias = {no: float('inf') for no in grafo.nodes()}
-    distancias[origem] = 0.0
+    n = len(id2name)
+    dist = [math.inf] * n
+    dist[s] = 0.0
+    pred = [-1] * n
+    
+    us, vs, pesos = grafo.edges_soa()
+    arestas = list(zip(us, vs, pesos))
+    
+    convergiu = False
+    for _ in range(n - 1):
+        mudou = False
+        for u, v, peso in arestas:
+            if dist[u] + peso < dist[v]:
+                dist[v] = dist[u] + peso
+                pred[v] = u
+                mudou = True
+            if dist[v] + peso < dist[u]:
+                dist[u] = dist[v] + peso
+                pred[u] = v
+                mudou = True
+        
+        if not mudou:
+            convergiu = True
+            break
+    
+    tem_ciclo_negativo = False
+    if not convergiu:
+        for u, v, peso in arestas:
+            if dist[u] + peso < dist[v] or dist[v] + peso < dist[u]:
+                tem_ciclo_negativo = True
+                break
+    
+    distancias = {no: dist[i] for no, i in name2id.items()}
     predecessores = {origem: None}
+    for i, p in enumerate(pred):
+        if p >= 0:
+            predecessores[id2name[i]] = id2name[p]
     
-    nos = grafo.nodes()
-    arestas = grafo.edges()
+    return distancias, predecessores, tem_ciclo_negativo
+
+
+def bellman_ford_spfa(grafo: Graph, origem: str) -> Tuple[Dict[str, float], Dict[str, str], bool]:
+    """
+    Bellman-Ford na variante SPFA (Shortest Path Faster Algorithm).
+    
+    Em vez de relaxar todas as arestas a cada rodada, mantém uma fila com
+    os nós cuja distância mudou e relaxa apenas as arestas deles. Cada nó
+    guarda o número de arestas do seu caminho atual; se ele chegar a n, o
+    caminho repete um nó e há ciclo negativo alcançável (detecção mais cedo
+    do que contar quantas vezes o nó entrou na fila). Usa as mesmas arestas
+    de bellman_ford (Graph.edges_soa), nos dois sentidos.
+    
+    Returns:
+        Tupla (distancias, predecessores, tem_ciclo_negativo), como em
+        bellman_ford; com ciclo negativo as distâncias são as do momento
+        da detecção e não têm significado
+    """
+    _, _, _, id2name, name2id = grafo.to_csr()
+    s = name2id.get(origem)
+    if s is None:
+        return {}, {}, False
     
-    for _ in range(len(nos) - 1):
-        for u, v, peso, _ in arestas:
-            if distancias[u] + peso < distancias[v]:
-                distancias[v] = distancias[u] + peso
-                predecessores[v] = u
-            if distancias[v] + peso < distancias[u]:
-                distancias[u] = distancias[v] + peso
-                predecessores[u] = v
+    n = len(id2name)
+    adj = [[] for _ in range(n)]
+    for u, v, peso in zip(*grafo.edges_soa()):
+        adj[u].append((v, peso))
+        adj[v].append((u, peso))
+    
+    dist = [math.inf] * n
+    dist[s] = 0.0
+    pred = [-1] * n
+    arestas_caminho = [0] * n
+    na_fila = bytearray(n)
+    fila = deque([s])
+    na_fila[s] = 1
     
     tem_ciclo_negativo = False
-    for u, v, peso, _ in arestas:
-        if distancias[u] + peso < distancias[v]:
-            tem_ciclo_negativo = True
-            break
-        if distancias[v] + peso < distancias[u]:
-            tem_ciclo_negativo = True
-            break
+    while fila and not tem_ciclo_negativo:
+        u = fila.popleft()
+        na_fila[u] = 0
+        du = dist[u]
+        for v, peso in adj[u]:
+            if du + peso < dist[v]:
+                dist[v] = du + peso
+                pred[v] = u
+                arestas_caminho[v] = arestas_caminho[u] + 1
+                if arestas_caminho[v] >= n:
+                    tem_ciclo_negativo = True
+                    break
+                if not na_fila[v]:
+                    na_fila[v] = 1
+                    fila.append(v)
+    
+    distancias = {no: dist[i] for no, i in name2id.items()}
+    predecessores = {origem: None}
+    for i, p in enumerate(pred):
+        if p >= 0:
+            predecessores[id2name[i]] = id2name[p]
     
     return distancias, predecessores, tem_ciclo_negativo
 
 
+def tem_ciclo_negativo_global(grafo: Graph) -> bool:
+    """
+    Verifica se há ciclo negativo em qualquer parte do grafo, com um único Bellman-Ford.
+    
+    Um Bellman-Ford a partir de uma origem só enxerga ciclos alcançáveis
+    dela. Aqui a origem é uma super-origem virtual ligada a todos os nós
+    com peso 0: depois da primeira rodada todas as distâncias valem 0,
+    então elas já começam em 0, sem copiar o grafo. Arestas de peso 0 não
+    criam ciclos novos, então se ainda houver relaxação após n - 1 rodadas
+    o ciclo negativo está no grafo original.
+    
+    Como Graph é não-direcionado e cada aresta é relaxada nos dois
+    sentidos, qualquer aresta negativa u–v já forma o ciclo u→v→u.
+    """
+    n = grafo.order()
+    if n == 0:
+        return False
+    
+    dist = [0.0] * n
+    us, vs, pesos = grafo.edges_soa()
+    arestas = list(zip(us, vs, pesos))
+    
+    for _ in range(n - 1):
+        mudou = False
+        for u, v, peso in arestas:
+            if dist[u] + peso < dist[v]:
+                dist[v] = dist[u] + peso
+                mudou = True
+            if dist[v] + peso < dist[u]:
+                dist[u] = dist[v] + peso
+                mudou = True
+        
+        if not mudou:
+            return False
+    
+    return any(dist[u] + peso < dist[v] or dist[v] + peso < dist[u] for u, v, peso in arestas)
+
+
 def reconstruir_caminho(predecessores: Dict[str, str], destino: str) -> List[str]:
     """
     Reconstrói o caminho do nó origem até o destino usando o dicionário de predecessores.
@@ -174,66 +571,262 @@ def reconstruir_caminho(predecessores: Dict[str, str], destino: str) -> List[str
     return list(reversed(caminho))
 
 
+@lru_cache(maxsize=32)
+def _dijkstra_origem_cache(id_grafo: int, versao: int, origem: str) -> Tuple[Dict[str, float], Dict[str, str]]:
+    return dijkstra(_grafos_registrados[id_grafo], origem)
+
+
+def dijkstra_de_origem(grafo: Graph, origem: str) -> Tuple[Dict[str, float], Dict[str, str]]:
+    """
+    Dijkstra a partir de origem, memoizado por (grafo, versão, origem).
+    
+    Guarda as árvores de caminhos mínimos das 32 origens mais recentes, de
+    modo que consultas com a mesma origem e destinos diferentes só precisam
+    reconstruir o caminho pelos predecessores. Os dicionários retornados são
+    compartilhados com o cache e não devem ser modificados.
+    
+    Returns:
+        Tupla (distancias, predecessores), como em dijkstra
+    """
+    _grafos_registrados[id(grafo)] = grafo
+    return _dijkstra_origem_cache(id(grafo), grafo.versao, origem)
+
+
+# Grafo de cada processo do pool de dijkstra_varias_origens (definido pelo initializer)
+_grafo_worker = None
+
+
+def _iniciar_worker_dijkstra(grafo: Graph):
+    global _grafo_worker
+    _grafo_worker = grafo
+
+
+def _dijkstra_worker(origem: str) -> Tuple[Dict[str, float], Dict[str, str]]:
+    return dijkstra(_grafo_worker, origem)
+
+
+def dijkstra_varias_origens(grafo: Graph, origens: List[str], paralelo: bool = None,
+                            processos: int = None) -> List[Tuple[Dict[str, float], Dict[str, str]]]:
+    """
+    Dijkstra a partir de cada origem, opcionalmente em paralelo (um processo por núcleo).
+    
+    Cada busca é independente, então origens distintas podem rodar em
+    processos separados (sem o GIL). O grafo é enviado uma vez a cada
+    processo, no initializer do pool, e não a cada tarefa. Criar o pool
+    custa dezenas de milissegundos, por isso por padrão só é usado com mais
+    de um núcleo e bastante trabalho: duas ou mais origens e origens ×
+    arestas acima de LIMITE_DIJKSTRA_PARALELO. No modo sequencial usa
+    dijkstra_de_origem (e o seu cache).
+    
+    Args:
+        grafo: Grafo com pesos não-negativos
+        origens: Nós de partida
+        paralelo: Força (True) ou desliga (False) o pool de processos; None
+            decide pelo tamanho do trabalho
+        processos: Número de processos do pool (None = núcleos da máquina)
+    
+    Returns:
+        Lista alinhada com origens de tuplas (distancias, predecessores),
+        como em dijkstra
+    """
+    if paralelo is None:
+        paralelo = ((os.cpu_count() or 1) > 1 and len(origens) >= 2
+                    and len(origens) * grafo.size() > LIMITE_DIJKSTRA_PARALELO)
+    
+    if not paralelo:
+        return [dijkstra_de_origem(grafo, origem) for origem in origens]
+    
+    with ProcessPoolExecutor(max_workers=processos, initializer=_iniciar_worker_dijkstra,
+                             initargs=(grafo,)) as executor:
+        return list(executor.map(_dijkstra_worker, origens))
+
+
+@lru_cache(maxsize=4096)
+def _caminho_minimo_cache(id_grafo: int, versao: int, origem: str, destino: str) -> Tuple[float, Tuple[str, ...]]:
+    distancias, predecessores = _dijkstra_origem_cache(id_grafo, versao, origem)
+    custo = distancias.get(destino, math.inf)
+    if math.isinf(custo):
+        return custo, ()
+    return custo, tuple(reconstruir_caminho(predecessores, destino))
+
+
+def caminho_minimo(grafo: Graph, origem: str, destino: str) -> Tuple[float, List[str]]:
+    """
+    Custo e caminho mínimo (Dijkstra) entre origem e destino, com memoização.
+    
+    Consultas repetidas do mesmo par no mesmo grafo são respondidas do
+    cache (LRU, 4096 pares); pares novos com uma origem já consultada reusam
+    a árvore de dijkstra_de_origem e custam só a reconstrução do caminho.
+    A chave inclui grafo.versao, que muda a cada add_node/add_edge, então
+    alterações no grafo invalidam as entradas.
+    
+    Returns:
+        Tupla (custo, caminho); sem caminho, (inf, [])
+    """
+    _grafos_registrados[id(grafo)] = grafo
+    custo, caminho = _caminho_minimo_cache(id(grafo), grafo.versao, origem, destino)
+    return custo, list(caminho)
+
+
 def densidade_ego(grafo: Graph, no: str) -> float:
     """
     Calcula a densidade da ego-subrede de um nó.
-    Densidade = arestas_reais / arestas_possíveis
+    Densidade = arestas_reais / arestas_possiveis
     
     A ego-subrede inclui o nó central e todos os seus vizinhos,
     além das conexões entre eles.
+    
+    Trabalha com conjuntos de índices inteiros da representação CSR: as
+    arestas da ego-subrede são os k raios até os vizinhos, mais os pares
+    de vizinhos adjacentes (interseção de conjuntos), mais os laços.
     """
-    if no not in grafo.nodes():
+    indptr, indices, _, _, name2id = grafo.to_csr()
+    centro = name2id.get(no)
+    if centro is None:
         return 0.0
     
-    vizinhos = set()
-    for v, _, _ in grafo.neighbors(no):
-        vizinhos.add(v)
+    vizinhos = set(indices[indptr[centro]:indptr[centro + 1]])
+    arestas_ego = 1 if centro in vizinhos else 0
+    vizinhos.discard(centro)
     
-    ego_nos = {no} | vizinhos
-    
-    if len(ego_nos) <= 1:
+    k = len(vizinhos)
+    if k == 0:
         return 0.0
     
-    arestas_ego = 0
-    arestas_vistas = set()
-    
-    for u in ego_nos:
-        for v, _, _ in grafo.neighbors(u):
-            if v in ego_nos:
-                aresta = tuple(sorted([u, v]))
-                if aresta not in arestas_vistas:
-                    arestas_vistas.add(aresta)
-                    arestas_ego += 1
+    pares = 0
+    for u in vizinhos:
+        vizinhos_u = set(indices[indptr[u]:indptr[u + 1]])
+        if u in vizinhos_u:
+            arestas_ego += 1
+            vizinhos_u.discard(u)
+        pares += len(vizinhos_u & vizinhos)
     
-    n = len(ego_nos)
-    arestas_possiveis = n * (n - 1) / 2
+    # Cada par de vizinhos adjacentes foi contado a partir das duas pontas
+    arestas_ego += k + pares // 2
+    arestas_possiveis = (k + 1) * k / 2
     
-    return arestas_ego / arestas_possiveis if arestas_possiveis > 0 else 0.0
+    return arestas_ego / arestas_possiveis
+
+
+def _tabela_vizinhos(indptr, indices) -> Tuple[List[Set[int]], List[bool]]:
+    # Conjunto de vizinhos (sem o próprio nó) de cada índice CSR e se o nó tem laço
+    vizinhos = []
+    lacos = []
+    for i in range(len(indptr) - 1):
+        viz = set(indices[indptr[i]:indptr[i + 1]])
+        lacos.append(i in viz)
+        viz.discard(i)
+        vizinhos.append(viz)
+    return vizinhos, lacos
+
+
+def _densidades_por_vizinhos(vizinhos: List[Set[int]], lacos: List[bool], nos) -> List[float]:
+    densidades = []
+    for no in nos:
+        viz = vizinhos[no]
+        k = len(viz)
+        if k == 0:
+            densidades.append(0.0)
+            continue
+
+        triangulos = sum(len(vizinhos[u] & viz) for u in viz) // 2
+        # Laços do centro e dos vizinhos contam uma vez cada, como em densidade_ego
+        lacos_ego = lacos[no] + sum(lacos[u] for u in viz)
+        arestas_possiveis = (k + 1) * k / 2
+        densidades.append((k + triangulos + lacos_ego) / arestas_possiveis)
+    return densidades
+
+
+# Tabela de vizinhos e laços de cada processo do pool de densidades_ego (definida pelo initializer)
+_tabela_worker = None
+
+
+def _iniciar_worker_densidades(indptr, indices):
+    global _tabela_worker
+    _tabela_worker = _tabela_vizinhos(indptr, indices)
+
+
+def _densidades_worker(bloco: Tuple[int, int]) -> List[float]:
+    return _densidades_por_vizinhos(*_tabela_worker, range(*bloco))
+
+
+def densidades_ego(grafo: Graph, paralelo: bool = None, processos: int = None) -> Dict[str, float]:
+    """
+    Calcula a densidade da ego-subrede de todos os nós de uma só vez.
+
+    Monta a tabela de vizinhos (conjuntos de índices CSR) uma única vez e,
+    para cada nó, conta as arestas entre seus vizinhos por interseção de
+    conjuntos (equivalente à soma da linha de (A·A)∘A na matriz de adjacência).
+    A ego-subrede de um nó com k vizinhos tem k+1 nós e k + triângulos
+    arestas, mais um para cada laço entre esses nós (como em densidade_ego).
+
+    Os nós são independentes entre si, então em grafos grandes (mais de
+    LIMITE_DENSIDADES_PARALELO arestas, com mais de um núcleo) são divididos
+    em blocos entre processos. Cada processo recebe só o CSR, no
+    initializer do pool, e monta a própria tabela de vizinhos.
+
+    Args:
+        grafo: Grafo a ser analisado
+        paralelo: Força (True) ou desliga (False) o pool de processos; None
+            decide pelo tamanho do grafo
+        processos: Número de processos do pool (None = núcleos da máquina)
+
+    Returns:
+        Dicionário {nó: densidade ego}, na ordem de grafo.nodes()
+    """
+    indptr, indices, _, id2name, name2id = grafo.to_csr()
+    n = len(id2name)
+
+    if paralelo is None:
+        paralelo = (os.cpu_count() or 1) > 1 and grafo.size() > LIMITE_DENSIDADES_PARALELO
+
+    if paralelo:
+        # Alguns blocos por processo equilibram nós de grau muito diferente
+        passo = max(1, -(-n // (4 * (processos or os.cpu_count() or 1))))
+        blocos = [(inicio, min(inicio + passo, n)) for inicio in range(0, n, passo)]
+        with ProcessPoolExecutor(max_workers=processos, initializer=_iniciar_worker_densidades,
+                                 initargs=(indptr, indices)) as executor:
+            valores = [d for parte in executor.map(_densidades_worker, blocos) for d in parte]
+    else:
+        valores = _densidades_por_vizinhos(*_tabela_vizinhos(indptr, indices), range(n))
+
+    return {no: valores[name2id[no]] for no in grafo.nodes()}
 
 
 def componentes_conexos(grafo: Graph) -> List[Set[str]]:
     """
-    Encontra todos os componentes conexos do grafo usando DFS.
+    Encontra todos os componentes conexos do grafo.
     Retorna uma lista de conjuntos, onde cada conjunto contém os nós de um componente.
+    
+    Faz uma inundação (BFS iterativa) sobre a representação CSR a partir de
+    cada nó ainda sem rótulo, marcando em rotulos o índice do componente;
+    os conjuntos de nomes só são montados no final.
     """
-    visitados = set()
-    componentes = []
+    indptr, indices, _, id2name, name2id = grafo.to_csr()
+    rotulos = [-1] * len(id2name)
+    membros = []
     
-    def dfs_componente(no: str, componente: Set[str]):
-        componente.add(no)
-        visitados.add(no)
+    for inicio in name2id.values():
+        if rotulos[inicio] >= 0:
+            continue
         
-        for vizinho, _, _ in grafo.neighbors(no):
-            if vizinho not in visitados:
-                dfs_componente(vizinho, componente)
-    
-    for no in grafo.nodes():
-        if no not in visitados:
-            componente = set()
-            dfs_componente(no, componente)
-            componentes.append(componente)
+        rotulo = len(membros)
+        rotulos[inicio] = rotulo
+        fila = [inicio]
+        cabeca = 0
+        
+        while cabeca < len(fila):
+            atual = fila[cabeca]
+            cabeca += 1
+            
+            for vizinho in indices[indptr[atual]:indptr[atual + 1]]:
+                if rotulos[vizinho] < 0:
+                    rotulos[vizinho] = rotulo
+                    fila.append(vizinho)
+        
+        membros.append(fila)
     
-    return componentes
+    return [{id2name[no] for no in fila} for fila in membros]
 
 
 def grau_medio(grafo: Graph) -> float:
@@ -1,5 +1,11 @@
+from array import array
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from itertools import count
+from typing import Dict, List
+
+# Fonte única de versões: cada alteração de qualquer grafo recebe um número novo,
+# então (id(grafo), versao) nunca se repete, mesmo que um id seja reaproveitado.
+_versoes = count()
 
 @dataclass
 class EdgeMeta:
@@ -7,44 +13,126 @@ class EdgeMeta:
     observacao: str | None = None
 
 class Graph:
+    # Nós ficam numa tabela indexada por inteiro (_names[i], _id[nome]) e a
+    # adjacência guarda só inteiros: para o nó i, _viz[i] tem os índices dos
+    # vizinhos e _arestas_no[i] o índice de cada aresta. Peso, extremidades e
+    # EdgeMeta ficam em listas paralelas indexadas pela aresta.
     def __init__(self):
-        self._adj: Dict[str, List[Tuple[str, float, EdgeMeta]]] = {}
+        self._id: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._viz: List[array] = []
+        self._arestas_no: List[array] = []
+        self._pesos = array('d')
+        self._metas: List[EdgeMeta] = []
+        self._alterado()
+
+    def _alterado(self):
+        # Invalida as representações em cache e marca uma nova versão do grafo
+        self._edges_cache = None
+        self._csr_cache = None
+        self._soa_cache = None
+        self.versao = next(_versoes)
 
     def add_node(self, u: str):
-        if u not in self._adj:
-            self._adj[u] = []
+        if u not in self._id:
+            self._id[u] = len(self._names)
+            self._names.append(u)
+            self._viz.append(array('i'))
+            self._arestas_no.append(array('i'))
+            self._alterado()
 
     def add_edge(self, u: str, v: str, w: float = 1.0, meta: EdgeMeta | None = None):
         if meta is None:
             meta = EdgeMeta()
         self.add_node(u)
         self.add_node(v)
-        self._adj[u].append((v, w, meta))
-        self._adj[v].append((u, w, meta))
+        i, j = self._id[u], self._id[v]
+        e = len(self._pesos)
+        self._pesos.append(w)
+        self._metas.append(meta)
+        self._viz[i].append(j)
+        self._arestas_no[i].append(e)
+        self._viz[j].append(i)
+        self._arestas_no[j].append(e)
+        self._alterado()
 
     def neighbors(self, u: str):
-        return self._adj.get(u, [])
+        i = self._id.get(u)
+        if i is None:
+            return []
+        names, pesos, metas = self._names, self._pesos, self._metas
+        return [(names[j], pesos[e], metas[e]) for j, e in zip(self._viz[i], self._arestas_no[i])]
 
     def nodes(self):
-        return list(self._adj.keys())
+        return list(self._names)
 
     def edges(self):
+        # A lista fica em cache até a próxima alteração do grafo (não modificar)
+        if self._edges_cache is not None:
+            return self._edges_cache
+        names, pesos, metas = self._names, self._pesos, self._metas
+        n = len(names)
+        # Cada par aparece primeiro na linha do menor índice, então j < i já
+        # foi visto; o conjunto de chaves int i*n+j só filtra arestas
+        # paralelas e a segunda metade dos laços
         seen = set()
         res = []
-        for u, lst in self._adj.items():
-            for v, w, meta in lst:
-                key = tuple(sorted((u, v)))
-                if key in seen:
+        for i in range(n):
+            base = i * n
+            for j, e in zip(self._viz[i], self._arestas_no[i]):
+                if j < i or base + j in seen:
                     continue
-                seen.add(key)
-                res.append((u, v, w, meta))
+                seen.add(base + j)
+                res.append((names[i], names[j], pesos[e], metas[e]))
+        self._edges_cache = res
         return res
 
     def degree(self, u: str) -> int:
-        return len(self._adj.get(u, []))
+        i = self._id.get(u)
+        return 0 if i is None else len(self._viz[i])
 
     def order(self) -> int:
-        return len(self._adj)
+        return len(self._names)
 
     def size(self) -> int:
-        return sum(len(v) for v in self._adj.values()) // 2
+        return len(self._pesos)
+
+    def to_csr(self):
+        # Adjacência em CSR (indptr, indices, weights) com nós indexados por inteiros.
+        # Os índices seguem a ordem alfabética dos nós (comparar índices equivale a
+        # comparar nomes) e os vizinhos mantêm a ordem da lista de adjacência.
+        # Fica em cache até a próxima alteração do grafo.
+        if self._csr_cache is None:
+            names = self._names
+            ordem = sorted(range(len(names)), key=names.__getitem__)
+            posicao = [0] * len(names)
+            for p, i in enumerate(ordem):
+                posicao[i] = p
+            id2name = [names[i] for i in ordem]
+            name2id = {no: posicao[i] for i, no in enumerate(names)}
+
+            indptr = array('i', [0])
+            indices = array('i')
+            weights = array('d')
+            pesos = self._pesos
+            for i in ordem:
+                indices.extend([posicao[j] for j in self._viz[i]])
+                weights.extend([pesos[e] for e in self._arestas_no[i]])
+                indptr.append(len(indices))
+
+            self._csr_cache = (indptr, indices, weights, id2name, name2id)
+        return self._csr_cache
+
+    def edges_soa(self):
+        # As arestas de edges() em estrutura de arrays (u, v, w), com os índices de to_csr.
+        if self._soa_cache is None:
+            name2id = self.to_csr()[4]
+            us = array('i')
+            vs = array('i')
+            ws = array('d')
+            for u, v, w, _ in self.edges():
+                us.append(name2id[u])
+                vs.append(name2id[v])
+                ws.append(w)
+            self._soa_cache = (us, vs, ws)
+        return self._soa_cache
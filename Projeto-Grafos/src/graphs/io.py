@@ -1,7 +1,14 @@
-import os, sys, re
+import os, sys, json, math
+from typing import Dict
+import numpy as np
 import pandas as pd
 from graphs.graph import Graph, EdgeMeta
 
+try:
+    import orjson
+except ImportError:  # orjson é opcional: sem ele salvar_json usa o json da biblioteca padrão
+    orjson = None
+
 CURRENT_FILE = os.path.abspath(__file__)
 CURRENT_DIR = os.path.dirname(CURRENT_FILE)
 ROOT_DIR = os.path.abspath(os.path.join(CURRENT_DIR, "..", ".."))
@@ -28,11 +35,9 @@ def melt_bairros(input_csv: str, output_csv: str):
         {"Setúbal": "Boa Viagem (Setúbal)", "Setubal": "Boa Viagem (Setúbal)"}
     )
 
-    def extrair_num_principal(valor):
-        m = re.match(r"^(\d+)", str(valor))
-        return m.group(1) if m else valor
-
-    melted["microrregiao"] = melted["microrregiao"].apply(extrair_num_principal)
+    # Número principal da microrregião ("1.2" -> "1") num único str.extract vetorizado
+    principal = melted["microrregiao"].astype(str).str.extract(r"^(\d+)", expand=False)
+    melted["microrregiao"] = principal.fillna(melted["microrregiao"])
     melted.to_csv(output_csv, index=False)
     return melted
 
@@ -41,33 +46,107 @@ def melt_bairros(input_csv: str, output_csv: str):
 
 
 
+# Grafos já carregados, por (caminho absoluto, mtime_ns, tamanho) do CSV de adjacências
+_grafos_carregados: Dict[tuple, Graph] = {}
+
+
 def carregar_adjacencias(bairros_unique_csv: str, adj_csv: str) -> Graph:
+    """
+    Carrega o grafo de bairros a partir do CSV de adjacências, com memoização.
+    
+    Cada etapa do projeto (métricas, distâncias, ranking, dashboard) carrega
+    o mesmo grafo; rodando várias na mesma execução (p.ex. cli.py --all), o
+    CSV é lido e o grafo montado uma única vez. A chave inclui mtime e
+    tamanho do arquivo, então uma alteração no CSV força nova leitura.
+    O grafo devolvido é compartilhado entre as chamadas (não modificar).
+    """
+    info = os.stat(adj_csv)
+    chave = (os.path.abspath(adj_csv), info.st_mtime_ns, info.st_size)
+    grafo = _grafos_carregados.get(chave)
+    if grafo is None:
+        grafo = _grafos_carregados[chave] = _montar_grafo_adjacencias(adj_csv)
+    return grafo
+
+
+def _montar_grafo_adjacencias(adj_csv: str) -> Graph:
     df_adj = pd.read_csv(adj_csv)
 
-    G = Graph()
+    # Limpeza dos nomes feita por coluna (acessor .str) em vez de linha a linha
+    setubal = {"Setúbal": "Boa Viagem", "Boa Viagem (Setúbal)": "Boa Viagem"}
+    origens = df_adj["bairro_origem"].astype(str).str.strip().str.title().replace(setubal)
+    destinos = df_adj["bairro_destino"].astype(str).str.strip().str.title().replace(setubal)
 
-    for _, r in df_adj.iterrows():
-        u = str(r["bairro_origem"]).strip().title()
-        v = str(r["bairro_destino"]).strip().title()
-        w = float(r.get("peso", 1.0))
+    def coluna(nome, padrao):
+        if nome in df_adj.columns:
+            return df_adj[nome].tolist()
+        return [padrao] * len(df_adj)
 
-        meta = EdgeMeta(
-            logradouro=r.get("logradouro"),
-            observacao=r.get("observacao")
-        )
+    # Pesos convertidos para float de uma vez (astype), não linha a linha
+    if "peso" in df_adj.columns:
+        pesos = df_adj["peso"].astype(float).tolist()
+    else:
+        pesos = [1.0] * len(df_adj)
 
-        if u in ["Setúbal", "Boa Viagem (Setúbal)"]:
-            u = "Boa Viagem"
-        if v in ["Setúbal", "Boa Viagem (Setúbal)"]:
-            v = "Boa Viagem"
+    G = Graph()
 
-        G.add_edge(u, v, w, meta)
+    for u, v, w, logradouro, observacao in zip(origens.tolist(), destinos.tolist(), pesos,
+                                               coluna("logradouro", None), coluna("observacao", None)):
+        G.add_edge(u, v, w, EdgeMeta(logradouro=logradouro, observacao=observacao))
 
     return G
 
 
 
 
+def _normalizar_json(obj):
+    """
+    Converte obj para tipos que orjson e json.dump serializam do mesmo jeito.
+    
+    Escalares e arrays numpy viram tipos Python, tuplas viram listas,
+    inf/NaN viram None (null) e chaves numéricas, booleanas ou None viram
+    strings como o json.dump as escreveria.
+    """
+    if isinstance(obj, dict):
+        return {_normalizar_chave_json(k): _normalizar_json(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_normalizar_json(v) for v in obj]
+    if isinstance(obj, np.ndarray):
+        return _normalizar_json(obj.tolist())
+    if isinstance(obj, np.generic):
+        return _normalizar_json(obj.item())
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    return obj
+
+
+def _normalizar_chave_json(chave):
+    if isinstance(chave, np.generic):
+        chave = chave.item()
+    if chave is None or isinstance(chave, (bool, int, float)):
+        return json.dumps(_normalizar_json(chave))
+    return chave
+
+
+def salvar_json(obj, caminho: str):
+    """
+    Salva obj como JSON indentado (2 espaços, UTF-8 sem escapes).
+    
+    Com orjson instalado a serialização é feita em C (bem mais rápida para
+    relatórios grandes, como o da Parte 2); sem ele, usa json.dump com a
+    mesma formatação. Nos dois casos obj passa antes por _normalizar_json,
+    então escalares/arrays numpy e chaves não-string são aceitos e inf/NaN
+    viram null, com o mesmo resultado em qualquer dos caminhos.
+    """
+    obj = _normalizar_json(obj)
+    if orjson is not None:
+        with open(caminho, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
+    
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, indent=2, allow_nan=False)
+
+
 def carregar_dataset_parte2(edges_path: str) -> Graph:
     """
     Carrega dataset maior (Parte 2) do formato .edges:
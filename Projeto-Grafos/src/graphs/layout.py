@@ -9,17 +9,275 @@ import random
 from typing import Dict, Tuple
 from graphs.graph import Graph
 
+try:
+    import numpy as np
+except ImportError:  # numpy é opcional: sem ele só os layouts em Python puro ficam disponíveis
+    np = None
 
-def spring_layout(grafo: Graph, k: float = 1.5, iterations: int = 50, seed: int = 42) -> Dict[str, Tuple[float, float]]:
+
+# Acima deste número de nós a repulsão do spring_layout usa Barnes-Hut
+LIMITE_BARNES_HUT = 300
+
+# Fração mínima dos nós com posição em initial_pos para o warm start valer
+FRACAO_WARM_START = 0.9
+
+
+def _quadtree_plana(P):
+    """
+    Monta a quadtree de Barnes-Hut em arrays planos, indexados pela célula.
+    
+    A célula c ocupa [x0[c], x0[c]+lado[c]) x [y0[c], y0[c]+lado[c]); seus
+    quatro filhos ficam em filho[c] .. filho[c]+3 (-1 numa folha). Os pontos
+    de uma folha formam uma lista encadeada a partir de primeiro[c], seguindo
+    proximo[i]. Cada ponto desce até uma folha vazia, que é subdividida
+    quando já tem um ponto; pontos (quase) coincidentes dividem a folha.
+    
+    Returns:
+        Tupla (lado, filho, primeiro, proximo, massa, cm_x, cm_y) de arrays numpy
+    """
+    xs = P[:, 0].tolist()
+    ys = P[:, 1].tolist()
+    n = len(xs)
+    
+    x_min, y_min = min(xs), min(ys)
+    x0 = [x_min]
+    y0 = [y_min]
+    lado = [max(max(xs) - x_min, max(ys) - y_min) * (1 + 1e-9) + 1e-9]
+    filho = [-1]
+    primeiro = [-1]
+    massa = [0]
+    soma_x = [0.0]
+    soma_y = [0.0]
+    proximo = [-1] * n
+    
+    for i in range(n):
+        x, y = xs[i], ys[i]
+        c = 0
+        while True:
+            massa[c] += 1
+            soma_x[c] += x
+            soma_y[c] += y
+            
+            if filho[c] < 0:
+                # Pontos (quase) coincidentes ficam juntos na mesma folha
+                if primeiro[c] < 0 or lado[c] < 1e-9:
+                    proximo[i] = primeiro[c]
+                    primeiro[c] = i
+                    break
+                
+                metade = lado[c] / 2
+                base = len(lado)
+                for q in range(4):
+                    x0.append(x0[c] + metade * (q & 1))
+                    y0.append(y0[c] + metade * (q >> 1))
+                    lado.append(metade)
+                    filho.append(-1)
+                    primeiro.append(-1)
+                    massa.append(0)
+                    soma_x.append(0.0)
+                    soma_y.append(0.0)
+                filho[c] = base
+                
+                j = primeiro[c]
+                primeiro[c] = -1
+                q = base + (xs[j] >= x0[c] + metade) + 2 * (ys[j] >= y0[c] + metade)
+                primeiro[q] = j
+                massa[q] = 1
+                soma_x[q] = xs[j]
+                soma_y[q] = ys[j]
+            
+            metade = lado[c] / 2
+            c = filho[c] + (x >= x0[c] + metade) + 2 * (y >= y0[c] + metade)
+    
+    massa = np.array(massa)
+    divisor = np.maximum(massa, 1)
+    return (np.array(lado), np.array(filho, dtype=np.intp), np.array(primeiro, dtype=np.intp),
+            np.array(proximo, dtype=np.intp), massa,
+            np.array(soma_x) / divisor, np.array(soma_y) / divisor)
+
+
+def _repulsao_barnes_hut_numpy(P, k_sq: float, theta: float):
+    """
+    Repulsão de Barnes-Hut sobre todos os nós ao mesmo tempo.
+    
+    Em vez de descer a árvore nó a nó, mantém uma fronteira de pares
+    (nó, célula) e processa um nível da quadtree por vez: pares cuja célula
+    passa no critério de abertura contribuem com massa · k² / d, folhas
+    contribuem ponto a ponto e o restante é expandido para os filhos.
+    Cada passo é uma operação vetorizada sobre toda a fronteira.
+    """
+    lado, filho, primeiro, proximo, massa, cm_x, cm_y = _quadtree_plana(P)
+    n = P.shape[0]
+    xs, ys = P[:, 0], P[:, 1]
+    fx = np.zeros(n)
+    fy = np.zeros(n)
+    theta_sq = theta * theta
+    
+    no = np.arange(n)
+    cel = np.zeros(n, dtype=np.intp)
+    
+    while no.size:
+        folha = filho[cel] < 0
+        
+        # Folhas: soma exata sobre a lista encadeada de pontos
+        no_f = no[folha]
+        j = primeiro[cel[folha]]
+        while no_f.size:
+            outro = j != no_f
+            a, b = no_f[outro], j[outro]
+            delta_x = xs[a] - xs[b]
+            delta_y = ys[a] - ys[b]
+            fator = k_sq / np.maximum(delta_x * delta_x + delta_y * delta_y, 0.0001)
+            fx += np.bincount(a, delta_x * fator, minlength=n)
+            fy += np.bincount(a, delta_y * fator, minlength=n)
+            j = proximo[j]
+            resta = j >= 0
+            no_f, j = no_f[resta], j[resta]
+        
+        no, cel = no[~folha], cel[~folha]
+        delta_x = xs[no] - cm_x[cel]
+        delta_y = ys[no] - cm_y[cel]
+        dist_sq = delta_x * delta_x + delta_y * delta_y
+        aceita = lado[cel] ** 2 < theta_sq * dist_sq
+        
+        fator = massa[cel[aceita]] * k_sq / dist_sq[aceita]
+        fx += np.bincount(no[aceita], delta_x[aceita] * fator, minlength=n)
+        fy += np.bincount(no[aceita], delta_y[aceita] * fator, minlength=n)
+        
+        no, cel = no[~aceita], cel[~aceita]
+        no = np.repeat(no, 4)
+        cel = (filho[cel][:, None] + np.arange(4)).ravel()
+        ocupada = massa[cel] > 0
+        no, cel = no[ocupada], cel[ocupada]
+    
+    return np.column_stack((fx, fy))
+
+
+def _arestas_indexadas(grafo: Graph, indice: Dict[str, int]):
+    """Arrays (eu, ev) com os índices das extremidades de cada aresta (sem laços)."""
+    arestas = [(indice[u], indice[v]) for u, v, _, _ in grafo.edges() if u != v]
+    eu = np.array([u for u, _ in arestas], dtype=np.intp)
+    ev = np.array([v for _, v in arestas], dtype=np.intp)
+    return eu, ev
+
+
+def _deslocamento_fr(P, eu, ev, k_ideal, theta=None, bloco=512):
+    """
+    Deslocamento do Fruchterman-Reingold para todas as posições P (n x 2).
+    
+    A repulsão k²/d entre todos os pares é calculada por broadcasting, em
+    blocos de linhas para limitar a memória a O(bloco · n), ou aproximada
+    por Barnes-Hut quando theta é informado; a atração d²/k é acumulada
+    sobre os arrays de arestas com np.bincount (uma soma esparsa por
+    coordenada, bem mais rápida que np.add.at). As distâncias são limitadas
+    inferiormente a 0.01, como na versão em Python puro.
+    """
+    n = P.shape[0]
+    k_sq = k_ideal * k_ideal
+    
+    if theta is not None:
+        disp = _repulsao_barnes_hut_numpy(P, k_sq, theta)
+    else:
+        disp = np.zeros_like(P)
+        for inicio in range(0, n, bloco):
+            fim = min(inicio + bloco, n)
+            D = P[inicio:fim, None, :] - P[None, :, :]
+            dist_sq = np.maximum((D * D).sum(axis=2), 0.0001)
+            # Na diagonal D é zero, então o próprio nó não contribui
+            disp[inicio:fim] = (D * (k_sq / dist_sq)[:, :, None]).sum(axis=1)
+    
+    dE = P[ev] - P[eu]
+    distancia = np.maximum(np.hypot(dE[:, 0], dE[:, 1]), 0.01)
+    f = dE * (distancia / k_ideal)[:, None]
+    for c in range(2):
+        disp[:, c] += np.bincount(eu, f[:, c], minlength=n) - np.bincount(ev, f[:, c], minlength=n)
+    
+    return disp
+
+
+def _posicoes_warm_start(grafo: Graph, nodes: list, initial_pos: Dict[str, Tuple[float, float]]):
+    """
+    Converte um layout anterior em posições iniciais para o spring_layout.
+    
+    As posições conhecidas são levadas para o quadrado [0.01, 0.99] usado
+    internamente; cada nó novo vai para o centróide dos vizinhos já
+    posicionados (com um pequeno ruído, para não coincidir com outro nó),
+    ou para um ponto aleatório se nenhum vizinho tiver posição.
+    
+    Returns:
+        Dicionário {nó: (x, y)}, ou None se initial_pos cobrir menos de
+        FRACAO_WARM_START dos nós
+    """
+    conhecidos = [node for node in nodes if node in initial_pos]
+    if len(conhecidos) < FRACAO_WARM_START * len(nodes):
+        return None
+    
+    xs = [initial_pos[node][0] for node in conhecidos]
+    ys = [initial_pos[node][1] for node in conhecidos]
+    min_x, min_y = min(xs), min(ys)
+    range_x = max(max(xs) - min_x, 0.01)
+    range_y = max(max(ys) - min_y, 0.01)
+    
+    pos = {}
+    for node, x, y in zip(conhecidos, xs, ys):
+        pos[node] = (0.01 + 0.98 * (x - min_x) / range_x,
+                     0.01 + 0.98 * (y - min_y) / range_y)
+    
+    for node in nodes:
+        if node in pos:
+            continue
+        vizinhos = [pos[v] for v, _, _ in grafo.neighbors(node) if v in pos]
+        if vizinhos:
+            cx = sum(x for x, _ in vizinhos) / len(vizinhos)
+            cy = sum(y for _, y in vizinhos) / len(vizinhos)
+            pos[node] = (min(0.99, max(0.01, cx + random.uniform(-0.01, 0.01))),
+                         min(0.99, max(0.01, cy + random.uniform(-0.01, 0.01))))
+        else:
+            pos[node] = (random.random(), random.random())
+    
+    return pos
+
+
+def spring_layout(grafo: Graph, k: float = 1.5, iterations: int = 50, seed: int = 42,
+                  theta: float = 0.5, barnes_hut: bool = None,
+                  initial_pos: Dict[str, Tuple[float, float]] = None,
+                  iterations_warm: int = 10,
+                  threshold: float = None) -> Dict[str, Tuple[float, float]]:
     """
     Implementação própria de spring layout (force-directed layout).
     Baseado no algoritmo de Fruchterman-Reingold.
     
+    A repulsão entre todos os pares custa O(n²) por iteração. Em grafos
+    grandes ela é aproximada por Barnes-Hut: uma quadtree das posições é
+    montada a cada iteração e grupos de nós distantes são tratados como
+    uma única massa, o que reduz o custo para O(n log n). Com numpy as
+    forças são calculadas de forma vetorizada; sem ele, em Python puro e
+    sempre com a repulsão exata (o Barnes-Hut exige numpy).
+    
+    Com initial_pos (um layout anterior, p.ex. de um grafo que ganhou ou
+    perdeu poucos nós) cobrindo ao menos FRACAO_WARM_START dos nós, o
+    layout parte dessas posições: nós novos nascem no centróide dos
+    vizinhos já posicionados e só iterations_warm iterações são feitas,
+    continuando o resfriamento de onde um layout completo terminaria.
+    
+    Com threshold, as iterações param assim que o deslocamento médio
+    efetivo dos nós numa iteração (já limitado à área [0.01, 0.99]) fica
+    abaixo dele: grafos pequenos, como o subgrafo de um percurso, podem
+    estabilizar antes de iterations. Sem threshold (padrão) todas as
+    iterações são feitas e o resultado não muda.
+    
     Args:
         grafo: Grafo a ser visualizado
         k: Distância ideal entre nós (parâmetro de controle)
         iterations: Número de iterações do algoritmo
         seed: Semente para reprodutibilidade
+        theta: Critério de abertura do Barnes-Hut (menor = mais preciso)
+        barnes_hut: Força (True) ou desliga (False) o Barnes-Hut; None
+            usa Barnes-Hut apenas acima de LIMITE_BARNES_HUT nós (só com numpy)
+        initial_pos: Layout anterior {nó: (x, y)} para warm start (opcional)
+        iterations_warm: Número de iterações quando há warm start
+        threshold: Deslocamento médio por nó abaixo do qual as iterações
+            param antes de iterations (None = sem parada antecipada)
     
     Returns:
         Dicionário {nó: (x, y)} com posições dos nós
@@ -35,70 +293,119 @@ def spring_layout(grafo: Graph, k: float = 1.5, iterations: int = 50, seed: int
     if n == 1:
         return {nodes[0]: (0.5, 0.5)}
     
-    pos = {}
-    for node in nodes:
-        pos[node] = (random.random(), random.random())
+    temperature = 0.1
+    
+    pos = _posicoes_warm_start(grafo, nodes, initial_pos) if initial_pos else None
+    if pos is not None:
+        # Retoma o resfriamento no ponto equivalente do layout completo
+        temperature *= iterations_warm / max(iterations, iterations_warm)
+        iterations = iterations_warm
+    else:
+        pos = {}
+        for node in nodes:
+            pos[node] = (random.random(), random.random())
     
     area = 1.0
     k_ideal = k * math.sqrt(area / n)
     
-    temperature = 0.1
     dt = temperature / (iterations + 1)
     
-    for iteration in range(iterations):
-        displacement = {node: (0.0, 0.0) for node in nodes}
+    if barnes_hut is None:
+        barnes_hut = n > LIMITE_BARNES_HUT
+    k_sq = k_ideal ** 2
+    
+    if np is not None:
+        P = np.array([pos[node] for node in nodes])
+        eu, ev = _arestas_indexadas(grafo, {node: i for i, node in enumerate(nodes)})
+        
+        for iteration in range(iterations):
+            disp = _deslocamento_fr(P, eu, ev, k_ideal, theta if barnes_hut else None)
+            comprimento = np.hypot(disp[:, 0], disp[:, 1])
+            movidos = comprimento > 0
+            fator = np.minimum(comprimento[movidos], temperature) / comprimento[movidos]
+            novas = np.clip(P[movidos] + disp[movidos] * fator[:, None], 0.01, 0.99)
+            if threshold is not None:
+                deslocamento = np.hypot(*(novas - P[movidos]).T).sum()
+            P[movidos] = novas
+            temperature -= dt
+            
+            if threshold is not None and deslocamento / n < threshold:
+                break
         
-        for i, v in enumerate(nodes):
-            for u in nodes[i+1:]:
-                delta_x = pos[v][0] - pos[u][0]
-                delta_y = pos[v][1] - pos[u][1]
+        pos = {node: (float(P[i, 0]), float(P[i, 1])) for i, node in enumerate(nodes)}
+    else:
+        # Em Python puro: invariantes fora dos laços e coordenadas em dois
+        # dicionários (px, py), sem tuplas nem lookups globais no laço O(n²)
+        sqrt = math.sqrt
+        px = {node: pos[node][0] for node in nodes}
+        py = {node: pos[node][1] for node in nodes}
+        arestas = [(u, v) for u, v, _, _ in grafo.edges()]
+        
+        for iteration in range(iterations):
+            deslocamento_total = 0.0
+            disp_x = dict.fromkeys(nodes, 0.0)
+            disp_y = dict.fromkeys(nodes, 0.0)
+            
+            for i, v in enumerate(nodes):
+                xv, yv = px[v], py[v]
+                for u in nodes[i+1:]:
+                    delta_x = xv - px[u]
+                    delta_y = yv - py[u]
+                    
+                    distance = sqrt(delta_x * delta_x + delta_y * delta_y)
+                    if distance < 0.01:
+                        distance = 0.01
+                    
+                    force = k_sq / distance
+                    
+                    fx = (delta_x / distance) * force
+                    fy = (delta_y / distance) * force
+                    
+                    disp_x[v] += fx
+                    disp_y[v] += fy
+                    disp_x[u] -= fx
+                    disp_y[u] -= fy
+            
+            for u, v in arestas:
+                delta_x = px[v] - px[u]
+                delta_y = py[v] - py[u]
                 
-                distance = math.sqrt(delta_x**2 + delta_y**2)
+                distance = sqrt(delta_x * delta_x + delta_y * delta_y)
                 if distance < 0.01:
                     distance = 0.01
                 
-                force = (k_ideal ** 2) / distance
+                force = (distance * distance) / k_ideal
                 
                 fx = (delta_x / distance) * force
                 fy = (delta_y / distance) * force
                 
-                displacement[v] = (displacement[v][0] + fx, displacement[v][1] + fy)
-                displacement[u] = (displacement[u][0] - fx, displacement[u][1] - fy)
-        
-        for u, v, peso, _ in grafo.edges():
-            delta_x = pos[v][0] - pos[u][0]
-            delta_y = pos[v][1] - pos[u][1]
+                disp_x[v] -= fx
+                disp_y[v] -= fy
+                disp_x[u] += fx
+                disp_y[u] += fy
             
-            distance = math.sqrt(delta_x**2 + delta_y**2)
-            if distance < 0.01:
-                distance = 0.01
-            
-            force = (distance ** 2) / k_ideal
-            
-            fx = (delta_x / distance) * force
-            fy = (delta_y / distance) * force
+            for node in nodes:
+                dx = disp_x[node]
+                dy = disp_y[node]
+                disp_length = sqrt(dx * dx + dy * dy)
+                
+                if disp_length > 0:
+                    limited_length = min(disp_length, temperature)
+                    dx = (dx / disp_length) * limited_length
+                    dy = (dy / disp_length) * limited_length
+                    
+                    x = max(0.01, min(0.99, px[node] + dx))
+                    y = max(0.01, min(0.99, py[node] + dy))
+                    deslocamento_total += sqrt((x - px[node]) ** 2 + (y - py[node]) ** 2)
+                    px[node] = x
+                    py[node] = y
             
-            displacement[v] = (displacement[v][0] - fx, displacement[v][1] - fy)
-            displacement[u] = (displacement[u][0] + fx, displacement[u][1] + fy)
-        
-        for node in nodes:
-            dx, dy = displacement[node]
-            disp_length = math.sqrt(dx**2 + dy**2)
+            temperature -= dt
             
-            if disp_length > 0:
-                limited_length = min(disp_length, temperature)
-                dx = (dx / disp_length) * limited_length
-                dy = (dy / disp_length) * limited_length
-                
-                new_x = pos[node][0] + dx
-                new_y = pos[node][1] + dy
-                
-                new_x = max(0.01, min(0.99, new_x))
-                new_y = max(0.01, min(0.99, new_y))
-                
-                pos[node] = (new_x, new_y)
+            if threshold is not None and deslocamento_total / n < threshold:
+                break
         
-        temperature -= dt
+        pos = {node: (px[node], py[node]) for node in nodes}
     
     if nodes:
         xs = [pos[node][0] for node in nodes]
@@ -118,6 +425,153 @@ def spring_layout(grafo: Graph, k: float = 1.5, iterations: int = 50, seed: int
     return pos
 
 
+def _energia_fr(P, eu, ev, k_ideal, gravidade, bloco=512):
+    """
+    Energia de Fruchterman-Reingold e seu gradiente analítico.
+    
+    E(P) = -k² Σ_{i<j} log d_ij + Σ_{(i,j)∈E} d_ij³ / (3k) + (g/2) Σ_i |P_i|²
+    
+    O gradiente dos dois primeiros termos reproduz as forças do FR (repulsão
+    k²/d e atração d²/k). O termo de gravidade impede que componentes
+    desconexas se afastem indefinidamente. A repulsão é calculada em blocos
+    de linhas para limitar a memória a O(bloco · n).
+    """
+    n = P.shape[0]
+    k_sq = k_ideal * k_ideal
+    eps_sq = 1e-4
+    
+    energia = 0.0
+    grad = np.zeros_like(P)
+    
+    for inicio in range(0, n, bloco):
+        fim = min(inicio + bloco, n)
+        D = P[inicio:fim, None, :] - P[None, :, :]
+        dist_sq = (D * D).sum(axis=2) + eps_sq
+        linhas = np.arange(fim - inicio)
+        dist_sq[linhas, linhas + inicio] = 1.0
+        
+        # Cada par aparece duas vezes no total (i,j) e (j,i): metade da energia
+        energia -= 0.25 * k_sq * np.log(dist_sq).sum()
+        coef = -k_sq / dist_sq
+        coef[linhas, linhas + inicio] = 0.0
+        grad[inicio:fim] += (coef[:, :, None] * D).sum(axis=1)
+    
+    dE = P[eu] - P[ev]
+    d_aresta = np.sqrt((dE * dE).sum(axis=1) + eps_sq)
+    energia += (d_aresta ** 3).sum() / (3 * k_ideal)
+    g = (d_aresta / k_ideal)[:, None] * dE
+    for c in range(P.shape[1]):
+        grad[:, c] += np.bincount(eu, g[:, c], minlength=n) - np.bincount(ev, g[:, c], minlength=n)
+    
+    energia += 0.5 * gravidade * (P * P).sum()
+    grad += gravidade * P
+    
+    return energia, grad
+
+
+def spring_layout_lbfgs(grafo: Graph, k: float = 1.5, max_iter: int = 100, seed: int = 42,
+                        gravidade: float = 0.1, memoria: int = 10,
+                        tol: float = 1e-5) -> Dict[str, Tuple[float, float]]:
+    """
+    Layout force-directed por minimização da energia de Fruchterman-Reingold.
+    
+    Em vez de aplicar as forças em passos de temperatura fixa, minimiza a
+    energia do FR com L-BFGS (quase-Newton de memória limitada, implementado
+    aqui com numpy), que converge em bem menos avaliações de força e costuma
+    chegar a mínimos mais planos em grafos grandes.
+    
+    Args:
+        grafo: Grafo a ser visualizado
+        k: Distância ideal entre nós (mesmo significado de spring_layout)
+        max_iter: Número máximo de iterações do L-BFGS
+        seed: Semente para reprodutibilidade
+        gravidade: Peso do termo que puxa os nós para o centro
+        memoria: Número de pares (s, y) guardados pelo L-BFGS
+        tol: Tolerância da norma do gradiente para parada
+    
+    Returns:
+        Dicionário {nó: (x, y)} com posições dos nós, normalizadas em [-1, 1]
+    """
+    if np is None:
+        return spring_layout(grafo, k=k, seed=seed)
+    
+    random.seed(seed)
+    
+    nodes = grafo.nodes()
+    n = len(nodes)
+    
+    if n == 0:
+        return {}
+    
+    if n == 1:
+        return {nodes[0]: (0.5, 0.5)}
+    
+    eu, ev = _arestas_indexadas(grafo, {node: i for i, node in enumerate(nodes)})
+    
+    k_ideal = k * math.sqrt(1.0 / n)
+    
+    P = np.array([(random.random(), random.random()) for _ in nodes])
+    energia, grad = _energia_fr(P, eu, ev, k_ideal, gravidade)
+    historico = []
+    
+    for _ in range(max_iter):
+        if np.linalg.norm(grad) < tol * n:
+            break
+        
+        # Recursão em dois laços: direção quase-Newton a partir do histórico
+        q = grad.ravel().copy()
+        alfas = []
+        for s_i, y_i, rho_i in reversed(historico):
+            alfa = rho_i * s_i.dot(q)
+            q -= alfa * y_i
+            alfas.append(alfa)
+        if historico:
+            s_i, y_i, _ = historico[-1]
+            q *= s_i.dot(y_i) / y_i.dot(y_i)
+        else:
+            q *= min(1.0, 0.1 / max(np.abs(q).max(), 1e-12))
+        for (s_i, y_i, rho_i), alfa in zip(historico, reversed(alfas)):
+            beta = rho_i * y_i.dot(q)
+            q += (alfa - beta) * s_i
+        direcao = -q.reshape(P.shape)
+        
+        inclinacao = (grad * direcao).sum()
+        if inclinacao >= 0:
+            historico.clear()
+            direcao = -grad
+            inclinacao = -(grad * grad).sum()
+        
+        # Busca linear com backtracking (condição de Armijo)
+        passo = 1.0
+        for _ in range(30):
+            P_novo = P + passo * direcao
+            energia_nova, grad_novo = _energia_fr(P_novo, eu, ev, k_ideal, gravidade)
+            if energia_nova <= energia + 1e-4 * passo * inclinacao:
+                break
+            passo *= 0.5
+        else:
+            break
+        
+        s_k = (P_novo - P).ravel()
+        y_k = (grad_novo - grad).ravel()
+        sy = s_k.dot(y_k)
+        if sy > 1e-12:
+            historico.append((s_k, y_k, 1.0 / sy))
+            if len(historico) > memoria:
+                historico.pop(0)
+        
+        variacao = abs(energia - energia_nova)
+        P, energia, grad = P_novo, energia_nova, grad_novo
+        if variacao <= tol * max(1.0, abs(energia)):
+            break
+    
+    minimo = P.min(axis=0)
+    amplitude = np.maximum(P.max(axis=0) - minimo, 0.01)
+    P = (P - minimo) / amplitude * 2 - 1
+    
+    return {node: (float(P[i, 0]), float(P[i, 1])) for i, node in enumerate(nodes)}
+
+
 def circular_layout(grafo: Graph, scale: float = 1.0) -> Dict[str, Tuple[float, float]]:
     """
     Layout circular simples - nós dispostos em círculo.
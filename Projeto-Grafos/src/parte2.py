@@ -14,11 +14,11 @@ Este módulo implementa todos os experimentos da Parte 2:
 import os
 import sys
 import time
-import json
-from collections import Counter
-import matplotlib.pyplot as plt
-import matplotlib
-matplotlib.use('Agg')  # Backend sem GUI
+import heapq
+import math
+from itertools import islice
+from operator import itemgetter
+import numpy as np
 
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 ROOT_DIR = os.path.abspath(os.path.join(CURRENT_DIR, ".."))
@@ -27,8 +27,8 @@ os.chdir(ROOT_DIR)
 if CURRENT_DIR not in sys.path:
     sys.path.insert(0, CURRENT_DIR)
 
-from graphs.io import carregar_dataset_parte2
-from graphs.algorithms import bfs, dfs, dijkstra, bellman_ford, reconstruir_caminho
+from graphs.io import carregar_dataset_parte2, salvar_json
+from graphs.algorithms import bfs, dfs, dijkstra_de_origem, bellman_ford_spfa, reconstruir_caminho
 from graphs.graph import Graph
 
 
@@ -38,6 +38,10 @@ def descrever_dataset(grafo: Graph) -> dict:
     - Número de nós (|V|)
     - Número de arestas (|E|)
     - Distribuição de graus (min, max, médio, histograma)
+    
+    Returns:
+        Tupla (descricao, graus, degree_map), com degree_map = {nó: grau}
+        calculado uma única vez e reaproveitado pelas etapas seguintes
     """
     print("\n" + "="*70)
     print("DESCRIÇÃO DO DATASET")
@@ -46,16 +50,21 @@ def descrever_dataset(grafo: Graph) -> dict:
     num_nos = grafo.order()
     num_arestas = grafo.size()
     
-    graus = [grafo.degree(no) for no in grafo.nodes()]
+    nos = grafo.nodes()
+    graus = np.fromiter((grafo.degree(no) for no in nos), dtype=np.int64, count=len(nos))
+    degree_map = dict(zip(nos, graus.tolist()))
     
-    if graus:
-        grau_min = min(graus)
-        grau_max = max(graus)
-        grau_medio = sum(graus) / len(graus)
+    if graus.size:
+        grau_min = int(graus.min())
+        grau_max = int(graus.max())
+        grau_medio = float(graus.mean())
         
-        # Distribuição de graus
-        dist_graus = Counter(graus)
-        dist_graus_top = dict(sorted(dist_graus.items(), key=lambda x: x[1], reverse=True)[:20])
+        # Distribuição de graus: contagem por grau com bincount; os 20 graus
+        # mais frequentes, empates na ordem em que o grau aparece nos nós
+        contagens = np.bincount(graus)
+        valores, primeira_ocorrencia = np.unique(graus, return_index=True)
+        ordem = np.lexsort((primeira_ocorrencia, -contagens[valores]))[:20]
+        dist_graus_top = {int(valores[i]): int(contagens[valores[i]]) for i in ordem}
     else:
         grau_min = grau_max = grau_medio = 0.0
         dist_graus_top = {}
@@ -78,22 +87,27 @@ def descrever_dataset(grafo: Graph) -> dict:
     print(f"Grau máximo: {grau_max}")
     print(f"Grau médio: {grau_medio:.2f}")
     
-    return descricao, graus
+    return descricao, graus, degree_map
 
 
-def rodar_bfs_dfs(grafo: Graph, fontes: list[str]) -> list[dict]:
+def rodar_bfs_dfs(grafo: Graph, fontes: list[str], nodes_set: set = None) -> list[dict]:
     """
     Executa BFS e DFS a partir de ≥3 fontes distintas.
     Relata ordem/camadas/nós alcançados para cada execução.
+    nodes_set (conjunto dos nós do grafo) evita montar a lista de nós a
+    cada verificação de pertinência; se omitido, é calculado aqui.
     """
     print("\n" + "="*70)
     print("EXPERIMENTOS BFS/DFS (≥3 fontes)")
     print("="*70)
     
+    if nodes_set is None:
+        nodes_set = set(grafo.nodes())
+    
     resultados = []
     
     for i, origem in enumerate(fontes, 1):
-        if origem not in grafo.nodes():
+        if origem not in nodes_set:
             print(f"\n⚠ Fonte {origem} não encontrada no grafo")
             continue
         
@@ -144,10 +158,15 @@ def rodar_bfs_dfs(grafo: Graph, fontes: list[str]) -> list[dict]:
     return resultados
 
 
-def rodar_dijkstra_pairs(grafo: Graph, pares: list[tuple[str, str]]) -> list[dict]:
+def rodar_dijkstra_pairs(grafo: Graph, pares: list[tuple[str, str]], nodes_set: set = None) -> list[dict]:
     """
     Executa Dijkstra com ≥5 pares origem-destino.
     Verifica pesos não-negativos e calcula caminhos mínimos.
+    Pares com a mesma origem reaproveitam a árvore do primeiro Dijkstra
+    (dijkstra_de_origem, memoizado por origem). O tempo registrado é sempre
+    o do Dijkstra da origem do par, medido quando ele rodou; o reuso fica
+    indicado à parte em sssp_reaproveitado.
+    nodes_set funciona como em rodar_bfs_dfs.
     """
     print("\n" + "="*70)
     print("EXPERIMENTOS DIJKSTRA (≥5 pares)")
@@ -167,23 +186,29 @@ def rodar_dijkstra_pairs(grafo: Graph, pares: list[tuple[str, str]]) -> list[dic
     
     print("✓ Todos os pesos são não-negativos (válido para Dijkstra)")
     
+    if nodes_set is None:
+        nodes_set = set(grafo.nodes())
+    
     resultados = []
+    tempos_sssp: dict[str, float] = {}
     
     for i, (origem, destino) in enumerate(pares, 1):
-        if origem not in grafo.nodes() or destino not in grafo.nodes():
+        if origem not in nodes_set or destino not in nodes_set:
             print(f"\n⚠ Par {i}: {origem} → {destino} - nós não encontrados")
             continue
         
         print(f"\n[{i}/{len(pares)}] Par: {origem} → {destino}")
         
+        reaproveitado = origem in tempos_sssp
         t0 = time.perf_counter()
-        distancias, predecessores = dijkstra(grafo, origem)
+        distancias, predecessores = dijkstra_de_origem(grafo, origem)
         t1 = time.perf_counter()
-        tempo_dijkstra = t1 - t0
+        # Em par de origem repetida vale o tempo do Dijkstra que montou a árvore
+        tempo_dijkstra = tempos_sssp.setdefault(origem, t1 - t0)
         
-        custo = distancias.get(destino, float("inf"))
+        custo = distancias.get(destino, math.inf)
         
-        if custo == float("inf"):
+        if math.isinf(custo):
             print(f"  ✗ Sem caminho")
             caminho = []
             tam_caminho = 0
@@ -193,15 +218,16 @@ def rodar_dijkstra_pairs(grafo: Graph, pares: list[tuple[str, str]]) -> list[dic
             print(f"  ✓ Custo: {custo:.2f}")
             print(f"  ✓ Caminho ({tam_caminho} nós): {' → '.join(caminho[:5])}{'...' if tam_caminho > 5 else ''}")
         
-        print(f"  ✓ Tempo: {tempo_dijkstra:.6f}s")
+        print(f"  ✓ Tempo: {tempo_dijkstra:.6f}s{' (Dijkstra da origem reaproveitado)' if reaproveitado else ''}")
         
         resultados.append({
             "algoritmo": "dijkstra",
             "origem": origem,
             "destino": destino,
-            "custo": None if custo == float("inf") else custo,
+            "custo": None if math.isinf(custo) else custo,
             "tam_caminho": tam_caminho,
             "tempo_seg": tempo_dijkstra,
+            "sssp_reaproveitado": reaproveitado,
         })
     
     return resultados
@@ -212,6 +238,9 @@ def rodar_bellman_ford_experimentos() -> list[dict]:
     Executa Bellman-Ford em dois casos:
     1. Grafo com pesos negativos sem ciclo negativo
     2. Grafo com ciclo negativo (detectado)
+    
+    Usa a variante SPFA (bellman_ford_spfa), que só relaxa as arestas dos
+    nós cuja distância mudou.
     """
     print("\n" + "="*70)
     print("EXPERIMENTOS BELLMAN-FORD (casos com pesos negativos)")
@@ -233,7 +262,7 @@ def rodar_bellman_ford_experimentos() -> list[dict]:
     print(f"  Origem: {origem1}")
     
     t0 = time.perf_counter()
-    distancias1, predecessores1, tem_ciclo1 = bellman_ford(G1, origem1)
+    distancias1, predecessores1, tem_ciclo1 = bellman_ford_spfa(G1, origem1)
     t1 = time.perf_counter()
     tempo_bf1 = t1 - t0
     
@@ -243,6 +272,7 @@ def rodar_bellman_ford_experimentos() -> list[dict]:
     
     resultados.append({
         "algoritmo": "bellman-ford",
+        "variante": "spfa",
         "dataset": "G1_negativo_sem_ciclo",
         "origem": origem1,
         "tem_ciclo_negativo": tem_ciclo1,
@@ -262,7 +292,7 @@ def rodar_bellman_ford_experimentos() -> list[dict]:
     print(f"  Origem: {origem2}")
     
     t0 = time.perf_counter()
-    distancias2, predecessores2, tem_ciclo2 = bellman_ford(G2, origem2)
+    distancias2, predecessores2, tem_ciclo2 = bellman_ford_spfa(G2, origem2)
     t1 = time.perf_counter()
     tempo_bf2 = t1 - t0
     
@@ -271,6 +301,7 @@ def rodar_bellman_ford_experimentos() -> list[dict]:
     
     resultados.append({
         "algoritmo": "bellman-ford",
+        "variante": "spfa",
         "dataset": "G2_ciclo_negativo",
         "origem": origem2,
         "tem_ciclo_negativo": tem_ciclo2,
@@ -281,7 +312,7 @@ def rodar_bellman_ford_experimentos() -> list[dict]:
     return resultados
 
 
-def gerar_visualizacao_distribuicao_graus(graus: list[int], out_dir: str):
+def gerar_visualizacao_distribuicao_graus(graus: np.ndarray, out_dir: str):
     """
     Gera histograma da distribuição de graus do dataset.
     Salva como out/parte2_distribuicao_graus.png
@@ -290,6 +321,12 @@ def gerar_visualizacao_distribuicao_graus(graus: list[int], out_dir: str):
     print("GERANDO VISUALIZAÇÃO: Distribuição de Graus")
     print("="*70)
     
+    # matplotlib só é carregado aqui: o pyplot leva ~0,3 s para importar e
+    # só este gráfico o usa (os experimentos e quem importa parte2 não pagam)
+    import matplotlib
+    matplotlib.use('Agg')  # Backend sem GUI
+    import matplotlib.pyplot as plt
+    
     plt.figure(figsize=(12, 6))
     
     # Histograma
@@ -300,9 +337,10 @@ def gerar_visualizacao_distribuicao_graus(graus: list[int], out_dir: str):
     plt.grid(axis='y', alpha=0.3, linestyle='--')
     
     # Estatísticas no gráfico
-    grau_min = min(graus)
-    grau_max = max(graus)
-    grau_medio = sum(graus) / len(graus)
+    graus = np.asarray(graus)
+    grau_min = graus.min()
+    grau_max = graus.max()
+    grau_medio = graus.mean()
     
     textstr = f'Min: {grau_min}\nMax: {grau_max}\nMédio: {grau_medio:.1f}'
     plt.text(0.98, 0.97, textstr, transform=plt.gca().transAxes,
@@ -318,37 +356,68 @@ def gerar_visualizacao_distribuicao_graus(graus: list[int], out_dir: str):
     print(f"✓ Visualização salva: {out_path}")
 
 
-def escolher_fontes_e_pares(grafo: Graph):
+def _no_na_posicao_por_grau(nos_com_grau: list[tuple[str, int]], posicao: int) -> str:
+    """
+    Nó na posição dada de sorted(nos_com_grau, por grau, reverse=True), sem ordenar a lista.
+    
+    Conta quantos nós há de cada grau para achar o grau da posição e
+    devolve o nó certo entre os desse grau, na ordem original (a mesma
+    ordem de empate da ordenação estável).
+    """
+    contagem = {}
+    for _, grau in nos_com_grau:
+        contagem[grau] = contagem.get(grau, 0) + 1
+    
+    for grau in sorted(contagem, reverse=True):
+        if posicao < contagem[grau]:
+            return next(islice((no for no, g in nos_com_grau if g == grau), posicao, None))
+        posicao -= contagem[grau]
+    
+    raise IndexError(posicao)
+
+
+def escolher_fontes_e_pares(grafo: Graph, degree_map: dict = None):
     """
     Escolhe 3 fontes e 5 pares de forma estratégica:
     - Fontes: nós com grau alto, médio e baixo
     - Pares: combinações variadas para testar diferentes cenários
+    
+    degree_map ({nó: grau}, como devolvido por descrever_dataset) evita
+    recalcular os graus; se omitido, é calculado aqui.
     """
     nos = list(grafo.nodes())
     
     # Calcular graus
-    nos_com_grau = [(no, grafo.degree(no)) for no in nos]
-    nos_ordenados = sorted(nos_com_grau, key=lambda x: x[1], reverse=True)
+    if degree_map is None:
+        degree_map = {no: grafo.degree(no) for no in nos}
+    nos_com_grau = [(no, degree_map[no]) for no in nos]
+    
+    # Da ordenação por grau decrescente (estável) só se usam os 10 primeiros,
+    # os 5 últimos e o do meio: seleção parcial em vez de ordenar tudo.
+    # maiores[i] é a posição i e menores[i] a posição -1 - i da ordenação.
+    maiores = heapq.nlargest(10, nos_com_grau, key=itemgetter(1))
+    menores = heapq.nsmallest(5, reversed(nos_com_grau), key=itemgetter(1))
     
     # Fontes: maior grau, mediano, menor grau
-    if len(nos_ordenados) >= 3:
+    if len(nos_com_grau) >= 3:
+        mediano = _no_na_posicao_por_grau(nos_com_grau, len(nos_com_grau) // 2)
         fontes = [
-            nos_ordenados[0][0],  # maior grau
-            nos_ordenados[len(nos_ordenados) // 2][0],  # mediano
-            nos_ordenados[-1][0],  # menor grau
+            maiores[0][0],  # maior grau
+            mediano,  # mediano
+            menores[0][0],  # menor grau
         ]
     else:
-        fontes = [no for no, _ in nos_ordenados]
+        fontes = [no for no, _ in maiores]
     
     # Pares: variações para testar distâncias diferentes
     pares = []
-    if len(nos_ordenados) >= 10:
+    if len(nos_com_grau) >= 10:
         pares = [
-            (nos_ordenados[0][0], nos_ordenados[5][0]),  # alto → médio-alto
-            (nos_ordenados[1][0], nos_ordenados[9][0]),  # alto → médio-baixo
-            (nos_ordenados[2][0], nos_ordenados[7][0]),  # alto → médio
-            (nos_ordenados[-1][0], nos_ordenados[0][0]),  # baixo → alto
-            (nos_ordenados[len(nos_ordenados) // 2][0], nos_ordenados[-5][0]),  # médio → baixo
+            (maiores[0][0], maiores[5][0]),  # alto → médio-alto
+            (maiores[1][0], maiores[9][0]),  # alto → médio-baixo
+            (maiores[2][0], maiores[7][0]),  # alto → médio
+            (menores[0][0], maiores[0][0]),  # baixo → alto
+            (mediano, menores[4][0]),  # médio → baixo
         ]
     else:
         # Dataset pequeno: pares simples
@@ -370,24 +439,25 @@ def rodar_experimentos_parte2(edges_path: str, out_dir: str = "out"):
     
     # Carregar dataset
     grafo = carregar_dataset_parte2(edges_path)
+    nodes_set = set(grafo.nodes())
     
     # 1. Descrever dataset
-    descricao, graus = descrever_dataset(grafo)
+    descricao, graus, degree_map = descrever_dataset(grafo)
     
     # 2. Escolher fontes e pares estrategicamente
-    fontes, pares = escolher_fontes_e_pares(grafo)
+    fontes, pares = escolher_fontes_e_pares(grafo, degree_map)
     
-    print(f"\nFontes selecionadas (graus): {[(f, grafo.degree(f)) for f in fontes]}")
+    print(f"\nFontes selecionadas (graus): {[(f, degree_map[f]) for f in fontes]}")
     print(f"Pares selecionados: {len(pares)} pares")
     
     # 3. Executar experimentos
     resultados = []
     
     # BFS/DFS (≥3 fontes)
-    resultados.extend(rodar_bfs_dfs(grafo, fontes))
+    resultados.extend(rodar_bfs_dfs(grafo, fontes, nodes_set))
     
     # Dijkstra (≥5 pares)
-    resultados.extend(rodar_dijkstra_pairs(grafo, pares))
+    resultados.extend(rodar_dijkstra_pairs(grafo, pares, nodes_set))
     
     # Bellman-Ford (casos negativos)
     resultados.extend(rodar_bellman_ford_experimentos())
@@ -411,8 +481,7 @@ def rodar_experimentos_parte2(edges_path: str, out_dir: str = "out"):
     }
     
     out_path = os.path.join(out_dir, "parte2_report.json")
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(parte2_report, f, ensure_ascii=False, indent=2)
+    salvar_json(parte2_report, out_path)
     
     print("\n" + "="*70)
     print("✓ PARTE 2 CONCLUÍDA COM SUCESSO!")
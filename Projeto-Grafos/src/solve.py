@@ -1,6 +1,6 @@
-import os, sys, json
+import os, sys, csv
 import pandas as pd
-from graphs.io import carregar_adjacencias
+from graphs.io import carregar_adjacencias, salvar_json
 from graphs.graph import Graph
 
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -8,15 +8,23 @@ ROOT_DIR = os.path.abspath(os.path.join(CURRENT_DIR, ".."))
 os.chdir(ROOT_DIR)
 
 def densidade(g: Graph) -> float:
-    v = g.order()
-    e = g.size()
+    return densidade_por_contagem(g.order(), g.size())
+
+def densidade_por_contagem(v: int, e: int) -> float:
     return 0 if v < 2 else 2 * e / (v * (v - 1))
 
 def subgrafo_por_bairros(G: Graph, bairros):
+    # Percorre só as arestas incidentes aos bairros (O(soma dos graus)), não
+    # todas as arestas de G; cada par entra uma vez, pela primeira aresta
+    bset = set(bairros)
     sub = Graph()
-    for u, v, w, meta in G.edges():
-        if u in bairros and v in bairros:
-            sub.add_edge(u, v, w, meta)
+    vistos = set()
+    for u in dict.fromkeys(bairros):
+        for v, w, meta in G.neighbors(u):
+            if v in bset and (u, v) not in vistos:
+                vistos.add((u, v))
+                vistos.add((v, u))
+                sub.add_edge(u, v, w, meta)
     return sub
 
 def calcular_metricas():
@@ -27,8 +35,7 @@ def calcular_metricas():
         "tamanho": int(G.size()),
         "densidade": float(round(densidade(G), 5)),
     }
-    with open("out/recife_global.json", "w", encoding="utf-8") as f:
-        json.dump(recife_global, f, ensure_ascii=False, indent=2)
+    salvar_json(recife_global, "out/recife_global.json")
 
     df_bairros = pd.read_csv("data/bairros_unique.csv")
     resultados_micro = []
@@ -41,24 +48,36 @@ def calcular_metricas():
             "tamanho": int(sub.size()),
             "densidade": float(round(densidade(sub), 4)),
         })
-    with open("out/microrregioes.json", "w", encoding="utf-8") as f:
-        json.dump(resultados_micro, f, ensure_ascii=False, indent=2)
+    salvar_json(resultados_micro, "out/microrregioes.json")
 
-    ego_data = []
-    for bairro in G.nodes():
-        vizinhos = [v for v, _, _ in G.neighbors(bairro)]
-        ego_nodes = [bairro] + vizinhos
-        ego = subgrafo_por_bairros(G, ego_nodes)
-        # Se nó isolado (grau 0), ego tem apenas 1 nó
-        ordem_ego = max(1, ego.order()) if G.degree(bairro) == 0 else ego.order()
-        ego_data.append({
-            "bairro": bairro,
-            "grau": int(G.degree(bairro)),
-            "ordem_ego": int(ordem_ego),
-            "tamanho_ego": int(ego.size()),
-            "densidade_ego": float(round(densidade(ego), 4)),
-        })
-    pd.DataFrame(ego_data).to_csv("out/ego_bairro.csv", index=False)
+    # Ordem e tamanho da ego-rede contados direto dos conjuntos de vizinhos,
+    # sem montar um Graph por bairro: a ordem é |{bairro} ∪ N(bairro)| e cada
+    # par adjacente dentro da ego conta uma vez (laço conta uma vez). Os
+    # conjuntos saem direto dos índices do CSR, sem as tuplas de neighbors()
+    indptr, indices, _, id2name, _ = G.to_csr()
+    adj = {no: {id2name[j] for j in indices[indptr[i]:indptr[i + 1]]} for i, no in enumerate(id2name)}
+    # As linhas vão direto para o CSV, sem lista de dicionários nem DataFrame
+    with open("out/ego_bairro.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["bairro", "grau", "ordem_ego", "tamanho_ego", "densidade_ego"])
+        for bairro in G.nodes():
+            if not adj[bairro]:
+                # Se nó isolado (grau 0), ego tem apenas 1 nó
+                ordem_ego, tamanho_ego = 1, 0
+            else:
+                ego_nodes = {bairro}
+                ego_nodes.update(adj[bairro])
+                incidencias = sum(len(adj[u] & ego_nodes) for u in ego_nodes)
+                lacos = sum(1 for u in ego_nodes if u in adj[u])
+                ordem_ego = len(ego_nodes)
+                tamanho_ego = (incidencias + lacos) // 2
+            writer.writerow([
+                bairro,
+                int(G.degree(bairro)),
+                int(ordem_ego),
+                int(tamanho_ego),
+                float(round(densidade_por_contagem(ordem_ego, tamanho_ego), 4)),
+            ])
 
 if __name__ == "__main__":
     calcular_metricas()
@@ -8,7 +8,7 @@ if SRC_DIR not in sys.path:
     sys.path.insert(0, SRC_DIR)
 
 from graphs.graph import Graph, EdgeMeta
-from graphs.algorithms import bellman_ford, reconstruir_caminho
+from graphs.algorithms import bellman_ford, bellman_ford_spfa, reconstruir_caminho, tem_ciclo_negativo_global
 
 
 def test_bellman_ford_simples():
@@ -141,6 +141,61 @@ def test_bellman_ford_caminho_linear():
     print(f"  Distâncias: {distancias}")
 
 
+def test_bellman_ford_spfa():
+    print("\n=== Teste 8: Bellman-Ford SPFA ===")
+    
+    g = Graph()
+    g.add_edge("A", "B", 1.0)
+    g.add_edge("A", "C", 4.0)
+    g.add_edge("B", "D", 2.0)
+    g.add_edge("C", "D", 1.0)
+    g.add_edge("D", "E", 3.0)
+    g.add_node("F")
+    
+    distancias, predecessores, tem_ciclo_neg = bellman_ford_spfa(g, "A")
+    distancias_bf, _, _ = bellman_ford(g, "A")
+    
+    assert not tem_ciclo_neg, "Não deve ter ciclo negativo"
+    assert distancias == distancias_bf, "SPFA deve dar as mesmas distâncias do Bellman-Ford"
+    assert reconstruir_caminho(predecessores, "E") == ["A", "B", "D", "E"], "Caminho deve ser A→B→D→E"
+    
+    g_ciclo = Graph()
+    g_ciclo.add_edge("X", "Y", 2.0)
+    g_ciclo.add_edge("Y", "Z", -3.0)
+    
+    _, _, tem_ciclo_neg = bellman_ford_spfa(g_ciclo, "X")
+    assert tem_ciclo_neg, "Aresta negativa não-direcionada forma ciclo negativo"
+    assert bellman_ford_spfa(g, "Z") == ({}, {}, False), "Nó inexistente não retorna distâncias"
+    
+    print("✓ SPFA coincide com o Bellman-Ford")
+    print(f"  Distâncias: {distancias}")
+
+
+def test_bellman_ford_ciclo_negativo_global():
+    print("\n=== Teste 9: Ciclo Negativo em Qualquer Parte do Grafo ===")
+    
+    # Componente A-B-C só com pesos positivos; o ciclo negativo fica em X-Y, fora do alcance de A
+    g = Graph()
+    g.add_edge("A", "B", 1.0)
+    g.add_edge("B", "C", 2.0)
+    g.add_edge("X", "Y", -1.0)
+    
+    _, _, tem_ciclo_a = bellman_ford(g, "A")
+    
+    assert not tem_ciclo_a, "Ciclo em X-Y não é alcançável a partir de A"
+    assert tem_ciclo_negativo_global(g), "Super-origem deve encontrar o ciclo fora do alcance de A"
+    
+    g_positivo = Graph()
+    g_positivo.add_edge("A", "B", 1.0)
+    g_positivo.add_edge("B", "C", 0.0)
+    g_positivo.add_node("D")
+    
+    assert not tem_ciclo_negativo_global(g_positivo), "Sem pesos negativos não há ciclo negativo"
+    assert not tem_ciclo_negativo_global(Graph()), "Grafo vazio não tem ciclo negativo"
+    
+    print("✓ Ciclo negativo encontrado fora do alcance da origem")
+
+
 def run_all_tests():
     print("=" * 70)
     print("EXECUTANDO TESTES: BELLMAN-FORD")
@@ -154,6 +209,8 @@ def run_all_tests():
         test_bellman_ford_grafo_completo()
         test_bellman_ford_no_inexistente()
         test_bellman_ford_caminho_linear()
+        test_bellman_ford_spfa()
+        test_bellman_ford_ciclo_negativo_global()
         
         print("\n" + "=" * 70)
         print("✓ TODOS OS TESTES DE BELLMAN-FORD PASSARAM!")
@@ -0,0 +1,162 @@
+import sys
+import os
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(CURRENT_DIR, ".."))
+SRC_DIR = os.path.join(ROOT_DIR, "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from graphs.graph import Graph, EdgeMeta
+from graphs.algorithms import densidade_ego, densidades_ego
+
+
+def test_densidade_ego_triangulo():
+    print("\n=== Teste 1: Densidade Ego Triângulo ===")
+
+    g = Graph()
+    g.add_edge("A", "B", 1.0)
+    g.add_edge("B", "C", 1.0)
+    g.add_edge("C", "A", 1.0)
+
+    densidades = densidades_ego(g)
+
+    assert densidades["A"] == 1.0, "Ego-rede de um triângulo é completa"
+    assert densidades["B"] == 1.0, "Ego-rede de um triângulo é completa"
+    assert densidades["C"] == 1.0, "Ego-rede de um triângulo é completa"
+
+    print("✓ Densidades corretas")
+    print(f"  Densidades: {densidades}")
+
+
+def test_densidade_ego_estrela():
+    print("\n=== Teste 2: Densidade Ego Estrela ===")
+
+    # Centro A ligado a B, C e D, sem arestas entre as folhas
+    g = Graph()
+    g.add_edge("A", "B", 1.0)
+    g.add_edge("A", "C", 1.0)
+    g.add_edge("A", "D", 1.0)
+
+    densidades = densidades_ego(g)
+
+    assert densidades["A"] == 0.5, "Ego de A tem 3 arestas de 6 possíveis"
+    assert densidades["B"] == 1.0, "Ego de uma folha é apenas a aresta até o centro"
+
+    print("✓ Estrela processada corretamente")
+    print(f"  Densidades: {densidades}")
+
+
+def test_densidade_ego_no_isolado():
+    print("\n=== Teste 3: Densidade Ego Nó Isolado ===")
+
+    g = Graph()
+    g.add_edge("A", "B", 1.0)
+    g.add_node("C")
+
+    densidades = densidades_ego(g)
+
+    assert densidades["C"] == 0.0, "Nó isolado deve ter densidade 0"
+    assert densidade_ego(g, "Z") == 0.0, "Nó inexistente deve ter densidade 0"
+
+    print("✓ Nó isolado tratado corretamente")
+
+
+def test_densidades_ego_igual_densidade_ego():
+    print("\n=== Teste 4: Densidades em Lote x Por Nó ===")
+
+    g = Graph()
+    g.add_edge("A", "B", 1.0)
+    g.add_edge("A", "C", 1.0)
+    g.add_edge("B", "C", 1.0)
+    g.add_edge("C", "D", 1.0)
+    g.add_edge("D", "E", 1.0)
+    g.add_edge("C", "E", 1.0)
+    g.add_edge("E", "F", 1.0)
+
+    densidades = densidades_ego(g)
+
+    for no in g.nodes():
+        assert abs(densidades[no] - densidade_ego(g, no)) < 1e-12, f"Densidade de {no} deve coincidir"
+
+    print("✓ Cálculo em lote coincide com o cálculo por nó")
+
+
+def test_densidades_ego_paralelo():
+    print("\n=== Teste 5: Densidades em Paralelo ===")
+
+    g = Graph()
+    g.add_edge("A", "B", 1.0)
+    g.add_edge("A", "C", 1.0)
+    g.add_edge("B", "C", 1.0)
+    g.add_edge("C", "D", 1.0)
+    g.add_edge("D", "D", 1.0)
+    g.add_node("E")
+
+    paralelo = densidades_ego(g, paralelo=True, processos=2)
+    sequencial = densidades_ego(g, paralelo=False)
+
+    assert paralelo == sequencial, "Pool de processos deve dar o mesmo resultado do modo sequencial"
+    assert list(paralelo) == g.nodes(), "Resultado deve seguir a ordem dos nós do grafo"
+
+    print("✓ Resultados em paralelo coincidem com o sequencial")
+
+
+def test_densidades_ego_com_laco():
+    print("\n=== Teste 6: Densidade Ego com Laço ===")
+
+    # Triângulo A-B-C com laço em A, D (grau 1) ligado a C com laço próprio,
+    # E isolado com laço e F isolado
+    g = Graph()
+    g.add_edge("A", "B", 1.0)
+    g.add_edge("B", "C", 1.0)
+    g.add_edge("C", "A", 1.0)
+    g.add_edge("A", "A", 1.0)
+    g.add_edge("C", "D", 1.0)
+    g.add_edge("D", "D", 1.0)
+    g.add_edge("E", "E", 1.0)
+    g.add_node("F")
+
+    densidades = densidades_ego(g)
+
+    assert densidades["B"] == 4 / 3, "Ego de B tem as 3 arestas do triângulo mais o laço de A"
+    assert densidades["D"] == 2.0, "Ego de D tem a aresta C-D mais o laço de D"
+    assert densidades["E"] == 0.0 and densidades["F"] == 0.0, "Nó sem vizinhos tem densidade 0, com ou sem laço"
+    for no in g.nodes():
+        assert abs(densidades[no] - densidade_ego(g, no)) < 1e-12, f"Laços devem contar igual nos dois cálculos ({no})"
+    assert densidades_ego(g, paralelo=True, processos=2) == densidades, "Pool de processos deve contar os laços igual"
+
+    print("✓ Laços contados igualmente em lote e por nó")
+    print(f"  Densidades: {densidades}")
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("EXECUTANDO TESTES: DENSIDADE EGO")
+    print("=" * 70)
+
+    try:
+        test_densidade_ego_triangulo()
+        test_densidade_ego_estrela()
+        test_densidade_ego_no_isolado()
+        test_densidades_ego_igual_densidade_ego()
+        test_densidades_ego_paralelo()
+        test_densidades_ego_com_laco()
+
+        print("\n" + "=" * 70)
+        print("✓ TODOS OS TESTES DE DENSIDADE EGO PASSARAM!")
+        print("=" * 70)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n✗ TESTE FALHOU: {e}")
+        return 1
+    except Exception as e:
+        print(f"\n✗ ERRO: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
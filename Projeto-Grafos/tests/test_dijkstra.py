@@ -8,7 +8,7 @@ if SRC_DIR not in sys.path:
     sys.path.insert(0, SRC_DIR)
 
 from graphs.graph import Graph, EdgeMeta
-from graphs.algorithms import dijkstra, reconstruir_caminho
+from graphs.algorithms import dijkstra, reconstruir_caminho, caminho_minimo, dijkstra_varias_origens
 
 
 def test_dijkstra_simples():
@@ -143,6 +143,89 @@ def test_dijkstra_no_inexistente():
     print("✓ Nó inexistente tratado corretamente")
 
 
+def test_dijkstra_caminho_minimo_cache():
+    print("\n=== Teste 8: Caminho Mínimo com Cache ===")
+    
+    # A -5- C direto, e A -1- B depois adicionada B -1- C
+    g = Graph()
+    g.add_edge("A", "C", 5.0)
+    g.add_edge("A", "B", 1.0)
+    
+    custo, caminho = caminho_minimo(g, "A", "C")
+    assert custo == 5.0 and caminho == ["A", "C"], "Antes do atalho, caminho é A→C"
+    assert caminho_minimo(g, "A", "C") == (5.0, ["A", "C"]), "Consulta repetida deve dar o mesmo resultado"
+    
+    g.add_edge("B", "C", 1.0)
+    custo, caminho = caminho_minimo(g, "A", "C")
+    assert custo == 2.0 and caminho == ["A", "B", "C"], "Alterar o grafo deve invalidar o cache"
+    
+    g.add_node("D")
+    assert caminho_minimo(g, "A", "D") == (float('inf'), []), "Sem caminho retorna (inf, [])"
+    
+    print("✓ Cache respeita alterações no grafo")
+    print(f"  Caminho: {' → '.join(caminho)}")
+
+
+def test_dijkstra_varias_origens_paralelo():
+    print("\n=== Teste 9: Dijkstra de Várias Origens em Paralelo ===")
+    
+    g = Graph()
+    g.add_edge("A", "B", 1.0)
+    g.add_edge("B", "C", 2.0)
+    g.add_edge("A", "C", 4.0)
+    g.add_edge("C", "D", 1.0)
+    g.add_node("E")
+    
+    origens = ["A", "C", "E"]
+    paralelo = dijkstra_varias_origens(g, origens, paralelo=True, processos=2)
+    sequencial = dijkstra_varias_origens(g, origens, paralelo=False)
+    
+    assert paralelo == sequencial, "Pool de processos deve dar o mesmo resultado do modo sequencial"
+    assert paralelo == [dijkstra(g, origem) for origem in origens], "Cada item deve ser o Dijkstra da origem"
+    assert paralelo[0][0]["D"] == 4.0, "Distância A→D deve ser 4"
+    
+    print("✓ Resultados em paralelo coincidem com o sequencial")
+
+
+def test_dijkstra_baldes_pesos_inteiros():
+    print("\n=== Teste 10: Dijkstra com Fila de Baldes (Pesos Inteiros) ===")
+    
+    # Pesos inteiros usam a fila de baldes; os mesmos pesos divididos por 2 usam o heap
+    arestas = [("A", "B", 2), ("A", "C", 1), ("C", "B", 1), ("B", "D", 3),
+               ("C", "D", 5), ("D", "E", 1), ("C", "E", 7)]
+    inteiros = Graph()
+    metades = Graph()
+    for u, v, w in arestas:
+        inteiros.add_edge(u, v, float(w))
+        metades.add_edge(u, v, w / 2)
+    
+    dist, pred = dijkstra(inteiros, "A")
+    dist_metades, pred_metades = dijkstra(metades, "A")
+    
+    assert dist == {no: 2 * d for no, d in dist_metades.items()}, "Distâncias devem ser proporcionais"
+    assert pred == pred_metades, "Empates devem ser resolvidos igual nas duas filas"
+    assert dist["E"] == 6.0, "Distância A→E deve ser 6"
+    
+    print("✓ Fila de baldes coincide com o heap")
+
+
+def test_dijkstra_aresta_negativa_termina():
+    print("\n=== Teste 11: Dijkstra com Aresta Negativa Termina ===")
+    
+    # Com a aresta negativa B-C, B→C→B realimentaria o heap sem a marca de fechados
+    g = Graph()
+    g.add_edge("A", "B", 2.0)
+    g.add_edge("B", "C", -1.0)
+    
+    distancias, predecessores = dijkstra(g, "A")
+    
+    assert distancias == {"A": 0.0, "B": 2.0, "C": 1.0}, "Nós fechados não devem ser reabertos"
+    assert predecessores["C"] == "B", "Predecessor de C deve ser B"
+    
+    print("✓ Dijkstra termina com aresta negativa")
+    print(f"  Distâncias: {distancias}")
+
+
 def run_all_tests():
     print("=" * 70)
     print("EXECUTANDO TESTES: DIJKSTRA")
@@ -156,6 +239,10 @@ def run_all_tests():
         test_dijkstra_grafo_completo()
         test_dijkstra_reconstruir_caminho()
         test_dijkstra_no_inexistente()
+        test_dijkstra_caminho_minimo_cache()
+        test_dijkstra_varias_origens_paralelo()
+        test_dijkstra_baldes_pesos_inteiros()
+        test_dijkstra_aresta_negativa_termina()
         
         print("\n" + "=" * 70)
         print("✓ TODOS OS TESTES DE DIJKSTRA PASSARAM!")
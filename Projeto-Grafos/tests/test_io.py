@@ -0,0 +1,123 @@
+import sys
+import os
+import json
+import tempfile
+
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(CURRENT_DIR, ".."))
+SRC_DIR = os.path.join(ROOT_DIR, "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+import numpy as np
+from graphs import io
+
+
+def _relatorio():
+    # Valores que orjson e json.dump tratariam de forma diferente sem normalização
+    return {
+        "nome": "Boa Viagem (Setúbal)",
+        "distancias": {"A": 0.0, "B": 2.5, "C": float("inf"), "D": float("nan")},
+        "contagem": np.int64(3),
+        "media": np.float64(1.25),
+        "infinito": np.float64("inf"),
+        "caminho": ("A", "B"),
+        "graus": np.array([1, 2, 3]),
+        "pesos": np.array([0.5, np.inf]),
+        1: "chave inteira",
+        np.int64(2): "chave numpy",
+        1.5: "chave float",
+        None: "chave nula",
+        "vazios": {"lista": [], "dict": {}},
+    }
+
+
+def _esperado():
+    return {
+        "nome": "Boa Viagem (Setúbal)",
+        "distancias": {"A": 0.0, "B": 2.5, "C": None, "D": None},
+        "contagem": 3,
+        "media": 1.25,
+        "infinito": None,
+        "caminho": ["A", "B"],
+        "graus": [1, 2, 3],
+        "pesos": [0.5, None],
+        "1": "chave inteira",
+        "2": "chave numpy",
+        "1.5": "chave float",
+        "null": "chave nula",
+        "vazios": {"lista": [], "dict": {}},
+    }
+
+
+def _salvar(obj, caminho, usar_orjson):
+    orjson_original = io.orjson
+    if not usar_orjson:
+        io.orjson = None
+    try:
+        io.salvar_json(obj, caminho)
+    finally:
+        io.orjson = orjson_original
+    with open(caminho, "rb") as f:
+        return f.read()
+
+
+def test_salvar_json_sem_orjson():
+    print("\n=== Teste 1: salvar_json sem orjson (json.dump) ===")
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "saida.json")
+        conteudo = _salvar(_relatorio(), caminho, usar_orjson=False)
+
+    assert b"Infinity" not in conteudo and b"NaN" not in conteudo, "inf/NaN devem virar null"
+    assert json.loads(conteudo) == _esperado(), "Valores numpy, tuplas e chaves devem ser normalizados"
+    assert "Setúbal".encode("utf-8") in conteudo, "Texto deve ser salvo em UTF-8 sem escapes"
+
+    print("✓ json.dump aceita numpy e grava inf/NaN como null")
+
+
+def test_salvar_json_orjson_igual_json():
+    print("\n=== Teste 2: salvar_json com orjson igual ao json.dump ===")
+
+    if io.orjson is None:
+        print("  orjson não instalado, teste ignorado")
+        return
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "saida.json")
+        com_orjson = _salvar(_relatorio(), caminho, usar_orjson=True)
+        sem_orjson = _salvar(_relatorio(), caminho, usar_orjson=False)
+
+    assert json.loads(com_orjson) == _esperado(), "orjson deve gravar os mesmos valores"
+    assert com_orjson == sem_orjson, "Os dois caminhos devem gerar o mesmo arquivo"
+
+    print("✓ orjson e json.dump geram o mesmo arquivo")
+    print(f"  Tamanho: {len(com_orjson)} bytes")
+
+
+def run_all_tests():
+    print("=" * 70)
+    print("EXECUTANDO TESTES: SALVAR JSON")
+    print("=" * 70)
+
+    try:
+        test_salvar_json_sem_orjson()
+        test_salvar_json_orjson_igual_json()
+
+        print("\n" + "=" * 70)
+        print("✓ TODOS OS TESTES DE SALVAR JSON PASSARAM!")
+        print("=" * 70)
+        return 0
+
+    except AssertionError as e:
+        print(f"\n✗ TESTE FALHOU: {e}")
+        return 1
+    except Exception as e:
+        print(f"\n✗ ERRO: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())